@@ -0,0 +1,125 @@
+"""Pair-distance and histogram kernels shared by the RDF analyses."""
+
+from __future__ import annotations
+
+import warnings
+
+import numpy as np
+from ase import Atoms
+from ase.neighborlist import neighbor_list
+from scipy.spatial.distance import pdist
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import cupy as cp
+except ImportError:
+    cp = None
+
+NUMBA_AVAILABLE = njit is not None
+CUPY_AVAILABLE = cp is not None
+RDF_BACKENDS = ("cpu", "cuda")
+
+# Above this size the O(N^2) pair matrix costs more than a cell list.
+BRUTE_FORCE_MAX_ATOMS = 2000
+
+
+def _histogram_kernel(
+    distances: np.ndarray, r_max: float, bins: int, counts: np.ndarray
+) -> None:
+    scale = bins / r_max
+    for value in distances:
+        if 0.0 <= value <= r_max:
+            index = int(value * scale)
+            # np.histogram puts values equal to the upper edge in the last bin.
+            if index == bins:
+                index -= 1
+            counts[index] += 1
+
+
+if NUMBA_AVAILABLE:
+    _histogram_kernel = njit(cache=True)(_histogram_kernel)
+
+
+def distance_histogram(distances: np.ndarray, r_max: float, bins: int) -> np.ndarray:
+    """Count distances in ``bins`` equal-width bins over ``[0, r_max]``.
+
+    Uses a single-pass Numba kernel when Numba is installed and falls back to
+    ``np.histogram`` otherwise; both return the same float64 counts.
+
+    Args:
+        distances: One-dimensional array of pair distances
+        r_max: Upper edge of the last bin
+        bins: Number of bins
+
+    Returns:
+        Bin counts as a float64 array of length ``bins``
+    """
+    if not NUMBA_AVAILABLE:
+        counts, _ = np.histogram(distances, bins=bins, range=(0.0, r_max))
+        return counts.astype(np.float64)
+    counts = np.zeros(bins, dtype=np.float64)
+    _histogram_kernel(np.ascontiguousarray(distances, dtype=np.float64), r_max, bins, counts)
+    return counts
+
+
+def pair_distances(atoms: Atoms, r_max: float) -> np.ndarray:
+    """Return directed pair distances below ``r_max`` (each pair counted twice).
+
+    Small non-periodic structures use a dense ``pdist`` over all pairs; anything
+    periodic or larger goes through ASE's cell-list ``neighbor_list`` so cost
+    and memory scale with the number of neighbours instead of N^2.
+
+    Args:
+        atoms: Structure to measure
+        r_max: Distance cutoff
+
+    Returns:
+        One-dimensional array of distances, matching ``neighbor_list("d", ...)``
+        up to ordering
+    """
+    if atoms.pbc.any() or len(atoms) > BRUTE_FORCE_MAX_ATOMS:
+        return neighbor_list("d", atoms, cutoff=r_max)
+    distances = pdist(atoms.positions)
+    distances = distances[distances < r_max]
+    return np.concatenate((distances, distances))
+
+
+def resolve_rdf_backend(backend: str) -> str:
+    """Validate ``backend``, falling back to CPU when CuPy is unavailable."""
+    key = backend.lower()
+    if key not in RDF_BACKENDS:
+        raise ValueError(f"Unknown RDF backend: {backend}. Use 'cpu' or 'cuda'.")
+    if key == "cuda" and not CUPY_AVAILABLE:
+        warnings.warn(
+            "CuPy is not installed; computing RDFs on the CPU instead.",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        return "cpu"
+    return key
+
+
+def cuda_distance_histogram(positions: np.ndarray, r_max: float, bins: int) -> np.ndarray:
+    """Histogram all directed pair distances on the GPU in single precision.
+
+    Builds the dense N x N distance matrix, so it only applies to non-periodic
+    frames and needs ``4 * N**2`` bytes of device memory.
+
+    Args:
+        positions: Cartesian positions with shape (N, 3)
+        r_max: Upper edge of the last bin
+        bins: Number of bins
+
+    Returns:
+        Bin counts as a float64 host array of length ``bins``
+    """
+    pos = cp.asarray(positions, dtype=cp.float32)
+    diff = pos[:, None, :] - pos[None, :, :]
+    distances = cp.sqrt((diff * diff).sum(axis=-1))
+    off_diagonal = ~cp.eye(len(positions), dtype=bool)
+    counts, _ = cp.histogram(distances[off_diagonal], bins=bins, range=(0.0, r_max))
+    return cp.asnumpy(counts).astype(np.float64)
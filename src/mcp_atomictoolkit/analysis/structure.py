@@ -11,8 +11,9 @@ import matplotlib.pyplot as plt
 import numpy as np
 from ase import Atoms
 from ase.data import covalent_radii
-from ase.neighborlist import NeighborList, neighbor_list
+from ase.neighborlist import NeighborList
 
+from mcp_atomictoolkit.analysis._histogram import distance_histogram, pair_distances
 from mcp_atomictoolkit.io_handlers import read_structure
 from mcp_atomictoolkit.structure_operations import get_structure_info
 
@@ -33,10 +34,11 @@ def _write_csv(rows: List[List], header: List[str], path: Path) -> None:
 def _compute_rdf(
     atoms: Atoms, r_max: float, bins: int
 ) -> Tuple[np.ndarray, np.ndarray]:
-    distances = neighbor_list("d", atoms, cutoff=r_max)
+    distances = pair_distances(atoms, r_max)
     if len(distances) == 0:
         return np.linspace(0.0, r_max, bins), np.zeros(bins)
-    hist, edges = np.histogram(distances, bins=bins, range=(0.0, r_max))
+    hist = distance_histogram(distances, r_max=r_max, bins=bins)
+    edges = np.linspace(0.0, r_max, bins + 1)
     r = 0.5 * (edges[1:] + edges[:-1])
     dr = edges[1] - edges[0]
     number_density = len(atoms) / atoms.get_volume() if atoms.get_volume() > 0 else 0
@@ -79,9 +81,15 @@ def analyze_structure(
     coordination_cutoff: Optional[float] = None,
     coordination_factor: float = 1.2,
     plot_formats: Optional[Sequence[str]] = None,
+    atoms: Optional[Atoms] = None,
 ) -> Dict:
-    """Analyze a structure file and write summary artifacts to disk."""
-    atoms = read_structure(filepath, format)
+    """Analyze a structure file and write summary artifacts to disk.
+
+    ``atoms`` may carry the already parsed contents of ``filepath`` so callers
+    that read the file themselves do not parse it twice.
+    """
+    if atoms is None:
+        atoms = read_structure(filepath, format)
     info = get_structure_info(atoms)
 
     output_path = Path(output_dir)
@@ -4,15 +4,24 @@ from __future__ import annotations
 
 import csv
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
 import matplotlib.pyplot as plt
 import numpy as np
 from ase import Atoms
 from ase.geometry import find_mic
-from ase.io import read
-from ase.neighborlist import neighbor_list
+from ase.io import iread
+
+from mcp_atomictoolkit.analysis._histogram import (
+    cuda_distance_histogram,
+    distance_histogram,
+    pair_distances,
+    resolve_rdf_backend,
+)
 
 
 def _write_json(data: Dict, path: Path) -> None:
@@ -28,18 +37,22 @@ def _write_csv(rows: List[List], header: List[str], path: Path) -> None:
         writer.writerows(rows)
 
 
-def _read_trajectory(filepath: str, format: Optional[str]) -> List[Atoms]:
-    frames = read(filepath, format=format, index=":")
-    if not isinstance(frames, list):
-        return [frames]
-    return frames
+def _read_trajectory(filepath: str, format: Optional[str]) -> Iterator[Atoms]:
+    """Yield trajectory frames one at a time instead of loading them all."""
+    return iread(filepath, format=format, index=":")
 
 
-def _compute_rdf(atoms: Atoms, r_max: float, bins: int) -> Tuple[np.ndarray, np.ndarray]:
-    distances = neighbor_list("d", atoms, cutoff=r_max)
-    if len(distances) == 0:
+def _compute_rdf(
+    atoms: Atoms, r_max: float, bins: int, backend: str = "cpu"
+) -> Tuple[np.ndarray, np.ndarray]:
+    if backend == "cuda" and not atoms.pbc.any():
+        hist = cuda_distance_histogram(atoms.positions, r_max=r_max, bins=bins)
+    else:
+        # Periodic frames need image distances, which the dense GPU matrix lacks.
+        hist = distance_histogram(pair_distances(atoms, r_max), r_max=r_max, bins=bins)
+    if not hist.any():
         return np.linspace(0.0, r_max, bins), np.zeros(bins)
-    hist, edges = np.histogram(distances, bins=bins, range=(0.0, r_max))
+    edges = np.linspace(0.0, r_max, bins + 1)
     r = 0.5 * (edges[1:] + edges[:-1])
     dr = edges[1] - edges[0]
     number_density = len(atoms) / atoms.get_volume() if atoms.get_volume() > 0 else 0
@@ -50,6 +63,13 @@ def _compute_rdf(atoms: Atoms, r_max: float, bins: int) -> Tuple[np.ndarray, np.
     return r, g_r
 
 
+def _rdf_workers(n_jobs: int) -> int:
+    """Return the RDF thread count for ``n_jobs`` (-1 means one per CPU)."""
+    if n_jobs == 0 or n_jobs < -1:
+        raise ValueError("n_jobs must be a positive integer or -1")
+    return (os.cpu_count() or 1) if n_jobs == -1 else n_jobs
+
+
 def _extract_energy(atoms: Atoms) -> float:
     for key in ("energy", "potential_energy", "E"):
         if key in atoms.info:
@@ -69,42 +89,74 @@ def analyze_trajectory(
     rdf_bins: int = 200,
     rdf_stride: int = 1,
     plot_formats: Optional[Sequence[str]] = None,
+    n_jobs: int = 1,
+    backend: str = "cpu",
 ) -> Dict:
-    """Analyze trajectory with MSD, RDF vs time, and thermodynamic stats."""
-    frames = _read_trajectory(filepath, format)
-    if not frames:
-        raise ValueError("No frames found in trajectory")
-
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
-
-    positions0 = frames[0].get_positions()
+    """Analyze trajectory with MSD, RDF vs time, and thermodynamic stats.
+
+    Per-frame RDFs are computed on ``n_jobs`` threads (-1 for all CPUs). The
+    default of 1 keeps the analysis serial so concurrent tool calls do not
+    oversubscribe the host.
+    ``backend="cuda"`` evaluates non-periodic frames on the GPU via CuPy and
+    falls back to the CPU with a warning when CuPy is not installed.
+    """
+    positions0 = None
+    num_frames = 0
     msd_rows = []
     msd_values = []
     temperatures = []
     kinetic_energies = []
     potential_energies = []
+    rdf_jobs = []
 
-    for idx, atoms in enumerate(frames):
-        delta = atoms.get_positions() - positions0
-        if np.any(atoms.pbc):
-            delta, _ = find_mic(delta, atoms.cell, atoms.pbc)
-        msd = float(np.mean(np.sum(delta**2, axis=1)))
-        time_fs = idx * timestep_fs
-        msd_rows.append([time_fs, msd])
-        msd_values.append(msd)
-
-        try:
-            temperatures.append(float(atoms.get_temperature()))
-        except Exception:
-            temperatures.append(float("nan"))
-
-        try:
-            kinetic_energies.append(float(atoms.get_kinetic_energy()))
-        except Exception:
-            kinetic_energies.append(float("nan"))
+    # Frames are streamed: each one feeds the running MSD/thermo series and,
+    # every rdf_stride frames, an RDF job. Only the pending RDF jobs keep a
+    # reference to their frame.
+    compute_rdf = partial(
+        _compute_rdf, r_max=rdf_max, bins=rdf_bins, backend=resolve_rdf_backend(backend)
+    )
+    workers = _rdf_workers(n_jobs)
+    executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        for idx, atoms in enumerate(_read_trajectory(filepath, format)):
+            num_frames += 1
+            if positions0 is None:
+                positions0 = atoms.get_positions()
+            delta = atoms.get_positions() - positions0
+            if np.any(atoms.pbc):
+                delta, _ = find_mic(delta, atoms.cell, atoms.pbc)
+            msd = float(np.mean(np.sum(delta**2, axis=1)))
+            time_fs = idx * timestep_fs
+            msd_rows.append([time_fs, msd])
+            msd_values.append(msd)
+
+            try:
+                temperatures.append(float(atoms.get_temperature()))
+            except Exception:
+                temperatures.append(float("nan"))
+
+            try:
+                kinetic_energies.append(float(atoms.get_kinetic_energy()))
+            except Exception:
+                kinetic_energies.append(float("nan"))
+
+            potential_energies.append(_extract_energy(atoms))
+
+            if idx % max(1, rdf_stride) == 0:
+                job = executor.submit(compute_rdf, atoms) if executor else compute_rdf(atoms)
+                rdf_jobs.append((idx, job))
+        rdf_results = [
+            (idx, job.result() if executor else job) for idx, job in rdf_jobs
+        ]
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    if num_frames == 0:
+        raise ValueError("No frames found in trajectory")
 
-        potential_energies.append(_extract_energy(atoms))
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
 
     msd_csv = output_path / "msd.csv"
     _write_csv(msd_rows, ["time_fs", "msd_A2"], msd_csv)
@@ -124,17 +176,14 @@ def analyze_trajectory(
         msd_plots[f"msd_plot_{fmt}"] = str(msd_plot.absolute())
     plt.close()
 
-    rdf_frames = []
-    for idx in range(0, len(frames), max(1, rdf_stride)):
-        atoms = frames[idx]
-        r, g_r = _compute_rdf(atoms, r_max=rdf_max, bins=rdf_bins)
-        rdf_frames.append(
-            {
-                "time_fs": idx * timestep_fs,
-                "r": r.tolist(),
-                "g_r": g_r.tolist(),
-            }
-        )
+    rdf_frames = [
+        {
+            "time_fs": idx * timestep_fs,
+            "r": r.tolist(),
+            "g_r": g_r.tolist(),
+        }
+        for idx, (r, g_r) in rdf_results
+    ]
 
     rdf_time_csv = output_path / "rdf_time.csv"
     rdf_rows = []
@@ -195,7 +244,7 @@ def analyze_trajectory(
     summary = {
         "input_filepath": str(Path(filepath).absolute()),
         "format": format or Path(filepath).suffix[1:],
-        "num_frames": len(frames),
+        "num_frames": num_frames,
         "timestep_fs": timestep_fs,
         "msd_final": msd_values[-1] if msd_values else 0.0,
         "temperature_stats": {
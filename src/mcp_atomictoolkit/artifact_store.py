@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import logging
 import mimetypes
 import os
 import re
 import json
+from concurrent.futures import CancelledError, Future
 from contextvars import ContextVar, Token
 from dataclasses import dataclass
 from pathlib import Path
@@ -12,6 +14,8 @@ from time import time
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 from uuid import uuid4
 
+logger = logging.getLogger("mcp_atomictoolkit.artifact_store")
+
 
 @dataclass(frozen=True)
 class ArtifactRecord:
@@ -21,15 +25,55 @@ class ArtifactRecord:
 
 
 class ArtifactStore:
-    """In-memory index of downloadable file artifacts."""
+    """In-memory index of downloadable file artifacts.
+
+    Files still being written in the background can be registered once their
+    write is tracked with :meth:`track_write`. Readers check
+    :meth:`pending_write` and wait on the returned future before serving the
+    file, and :meth:`write_error` reports a background write that failed.
+    """
 
     def __init__(self) -> None:
         self._records: Dict[str, ArtifactRecord] = {}
+        self._pending_writes: Dict[Path, Future] = {}
+        self._pending_records: Dict[str, Future] = {}
+        self._write_errors: Dict[Path, str] = {}
         self._lock = Lock()
 
+    def track_write(self, filepath: str | Path, future: Future) -> None:
+        """Mark ``filepath`` as being written by ``future``."""
+        path = Path(filepath).expanduser().resolve()
+        with self._lock:
+            self._pending_writes[path] = future
+            self._write_errors.pop(path, None)
+        future.add_done_callback(lambda done: self._finish_write(path, done))
+
+    def _finish_write(self, path: Path, future: Future) -> None:
+        error = CancelledError() if future.cancelled() else future.exception()
+        with self._lock:
+            if self._pending_writes.get(path) is future:
+                del self._pending_writes[path]
+            for artifact_id in [
+                artifact_id
+                for artifact_id, pending in self._pending_records.items()
+                if pending is future
+            ]:
+                del self._pending_records[artifact_id]
+            if error is not None:
+                self._write_errors[path] = f"{type(error).__name__}: {error}"
+        if error is not None:
+            logger.error("Background write of %s failed: %s", path, error)
+
+    def is_pending(self, filepath: str | Path) -> bool:
+        path = Path(filepath).expanduser().resolve()
+        with self._lock:
+            return path in self._pending_writes
+
     def register(self, filepath: str | Path) -> ArtifactRecord:
         path = Path(filepath).expanduser().resolve()
-        if not path.exists() or not path.is_file():
+        with self._lock:
+            pending = self._pending_writes.get(path)
+        if pending is None and (not path.exists() or not path.is_file()):
             raise FileNotFoundError(f"Artifact file not found: {path}")
 
         record = ArtifactRecord(
@@ -39,12 +83,27 @@ class ArtifactStore:
         )
         with self._lock:
             self._records[record.artifact_id] = record
+            # Re-check under the lock: a write finishing in between has
+            # already run its cleanup and must not leave an entry behind.
+            pending = self._pending_writes.get(path)
+            if pending is not None and not pending.done():
+                self._pending_records[record.artifact_id] = pending
         return record
 
     def get(self, artifact_id: str) -> Optional[ArtifactRecord]:
         with self._lock:
             return self._records.get(artifact_id)
 
+    def pending_write(self, artifact_id: str) -> Optional[Future]:
+        """Return the unfinished background write for ``artifact_id``, if any."""
+        with self._lock:
+            return self._pending_records.get(artifact_id)
+
+    def write_error(self, record: ArtifactRecord) -> Optional[str]:
+        """Return the error of a failed background write of ``record``'s file."""
+        with self._lock:
+            return self._write_errors.get(record.filepath)
+
 
 artifact_store = ArtifactStore()
 _request_base_url: ContextVar[Optional[str]] = ContextVar("artifact_request_base_url", default=None)
@@ -76,9 +135,9 @@ def _is_artifact_candidate(value: Any) -> bool:
     if not isinstance(value, str):
         return False
     path = Path(value).expanduser()
-    if not path.exists() or not path.is_file():
+    if path.suffix.lower() not in _ALLOWED_SUFFIXES:
         return False
-    return path.suffix.lower() in _ALLOWED_SUFFIXES
+    return path.is_file() or artifact_store.is_pending(path)
 
 
 def _iter_candidate_paths(data: Any) -> Iterable[Tuple[str, str]]:
@@ -104,6 +163,13 @@ def _artifact_base_url() -> str:
     return ""
 
 
+def artifact_download_url(record: ArtifactRecord) -> str:
+    """Return the download URL of a registered artifact."""
+    base_url = _artifact_base_url()
+    rel_url = f"/artifacts/{record.artifact_id}/{record.filepath.name}"
+    return f"{base_url}{rel_url}" if base_url else rel_url
+
+
 def set_request_base_url(base_url: str) -> Token:
     """Set request-scoped base URL for artifact links in the active context."""
     return _request_base_url.set(base_url.rstrip("/"))
@@ -120,7 +186,7 @@ def _guess_artifact_type(path: Path) -> str:
         return "image"
     if suffix in {".xyz", ".extxyz", ".traj", ".cif", ".vasp", ".poscar"}:
         return "structure"
-    if suffix in {".csv", ".dat"}:
+    if suffix in {".csv", ".dat", ".npy"}:
         return "table"
     return "file"
 
@@ -2,8 +2,10 @@
 
 import logging
 import os
+import threading
 import warnings
-from typing import TYPE_CHECKING, Sequence
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Sequence
 
 if TYPE_CHECKING:
     from nequix.calculator import NequixCalculator
@@ -13,12 +15,24 @@ if TYPE_CHECKING:
 NEQUIX_DEFAULT_MODEL = "nequix-mp-1"
 NEQUIX_DEFAULT_BACKEND = "jax"
 KIM_DEFAULT_MODEL = "LJ_ElliottAkerson_2015_Universal__MO_959249795837_003"
+JAX_COMPILATION_CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "mcp_atomictoolkit", "jax"
+)
 # Default to auto-selection so low-resource environments can fall back when
 # heavyweight dependencies (e.g., KIM API) are unavailable.
 DEFAULT_CALCULATOR_NAME = "auto"
 
 logger = logging.getLogger("mcp_atomictoolkit.calculators")
 
+# MLIP calculators are expensive to build (weights loading, JAX/XLA tracing),
+# so instances are reused per thread. ASE calculators are not thread-safe,
+# hence a thread-local registry rather than a process-wide one. Each thread
+# keeps a small LRU because every species set can build its own KIM model.
+# Cached instances are handed out as-is, never reset: ASE recomputes when the
+# Atoms changes, and an Atoms that keeps its results past the next
+# calculation on the same thread must be detached first (SinglePointCalculator).
+_CALCULATOR_CACHE_SIZE = 8
+_calculator_cache = threading.local()
 
 def _configure_jax_for_cpu() -> None:
     """Force JAX/Nequix execution on CPU-only runtimes."""
@@ -33,11 +47,57 @@ def _configure_jax_for_cpu() -> None:
     os.environ["JAX_CUDA_VISIBLE_DEVICES"] = ""
 
 
+def _configure_jax_compilation_cache() -> None:
+    """Enable JAX's persistent compilation cache unless the host configured one.
+
+    Nequix compiles its force evaluation per input shape; persisting the XLA
+    executables lets repeated relaxations (and server restarts) skip retracing.
+    """
+    os.environ.setdefault("JAX_COMPILATION_CACHE_DIR", JAX_COMPILATION_CACHE_DIR)
+
+
 # Configure CPU-only defaults as soon as this module is imported so that any
 # later JAX imports (triggered inside Nequix) inherit the safe environment.
 _configure_jax_for_cpu()
 
 
+def _thread_cache() -> "OrderedDict[Hashable, Any]":
+    cache = getattr(_calculator_cache, "calculators", None)
+    if cache is None:
+        cache = _calculator_cache.calculators = OrderedDict()
+    return cache
+
+
+def _cache_get(key: Hashable) -> Any:
+    cache = _thread_cache()
+    if key not in cache:
+        return None
+    cache.move_to_end(key)
+    return cache[key]
+
+
+def _cache_put(key: Hashable, value: Any) -> Any:
+    cache = _thread_cache()
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > _CALCULATOR_CACHE_SIZE:
+        cache.popitem(last=False)
+    return value
+
+
+def _cached_calculator(key: Hashable, factory: Callable[[], Any]) -> Any:
+    """Return the calculator cached for ``key`` on this thread, building it on a miss."""
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+    return _cache_put(key, factory())
+
+
+def clear_calculator_cache() -> None:
+    """Drop all calculators cached for the current thread."""
+    _calculator_cache.calculators = OrderedDict()
+
+
 def _normalize_calculator_name(calculator_name: str) -> str:
     """Return canonical calculator key, accepting common aliases/typos."""
     normalized = calculator_name.strip().lower()
@@ -54,12 +114,28 @@ def _normalize_calculator_name(calculator_name: str) -> str:
     return aliases.get(normalized, normalized)
 
 
+def _freeze_torch_model(model: Any) -> None:
+    """Put a torch model in inference-only mode (eval, no parameter gradients).
+
+    Forces may still be obtained by differentiating with respect to positions;
+    only the autograd bookkeeping on the weights is dropped.
+    """
+    if hasattr(model, "eval"):
+        model.eval()
+    parameters = getattr(model, "parameters", None)
+    if parameters is None:
+        return
+    for parameter in parameters():
+        parameter.requires_grad_(False)
+
+
 def get_orb_calculator() -> "ORBCalculator":
     """Initialize Orb calculator."""
     from orb_models.forcefield import pretrained
     from orb_models.forcefield.calculator import ORBCalculator
 
     orbff = pretrained.orb_v2(device="cpu")
+    _freeze_torch_model(orbff)
     calculator = ORBCalculator(orbff, device="cpu")
     return calculator
 
@@ -71,6 +147,7 @@ def get_nequix_calculator(
     """Initialize Nequix calculator on CPU."""
     if backend == "jax":
         _configure_jax_for_cpu()
+        _configure_jax_compilation_cache()
 
     from nequix.calculator import NequixCalculator
 
@@ -88,6 +165,19 @@ def _normalize_species(species: Sequence[str] | None) -> list[str]:
     return sorted(unique_species)
 
 
+def _coerce_kim_model_id(entry: Any) -> str:
+    """Extract a KIM model ID from a kim-query result entry."""
+    if isinstance(entry, str):
+        return entry
+    if isinstance(entry, dict):
+        for key in ("model", "model_id", "kim_id", "extended_id", "id"):
+            value = entry.get(key)
+            if value:
+                return value
+        return KIM_DEFAULT_MODEL
+    return str(entry)
+
+
 def _select_kim_model_id(
     species: Sequence[str] | None,
 ) -> str:
@@ -126,16 +216,7 @@ def _select_kim_model_id(
     if not models:
         return KIM_DEFAULT_MODEL
 
-    first = models[0]
-    if isinstance(first, str):
-        return first
-    if isinstance(first, dict):
-        for key in ("model", "model_id", "kim_id", "extended_id", "id"):
-            value = first.get(key)
-            if value:
-                return value
-        return KIM_DEFAULT_MODEL
-    return str(first)
+    return _coerce_kim_model_id(models[0])
 
 
 def get_kim_calculator(
@@ -183,9 +264,12 @@ def _get_calculator_by_key(
     species: Sequence[str] | None,
 ) -> "ORBCalculator | NequixCalculator | KIMCalculator":
     if calculator_key == "orb":
-        return get_orb_calculator()
+        return _cached_calculator(("orb", "cpu"), get_orb_calculator)
     if calculator_key == "nequix":
-        return get_nequix_calculator()
+        return _cached_calculator(
+            ("nequix", NEQUIX_DEFAULT_MODEL, NEQUIX_DEFAULT_BACKEND),
+            get_nequix_calculator,
+        )
     if calculator_key == "kim":
         return get_kim_calculator(species=species)
     raise ValueError(f"Unknown MLIP type: {calculator_key}")
@@ -195,7 +279,32 @@ def resolve_calculator(
     calculator_name: str,
     species: Sequence[str] | None = None,
 ) -> tuple["ORBCalculator | NequixCalculator | KIMCalculator", str, list[str]]:
-    """Resolve a calculator, optionally falling back when auto-selection is used."""
+    """Resolve a calculator, optionally falling back when auto-selection is used.
+
+    Resolutions that succeed without falling back are cached per thread (LRU)
+    by calculator name and species, so repeated workflow calls skip model
+    loading. Resolutions that hit errors are not cached, so a transient load
+    failure is retried on the next call. The cached instance is returned
+    without a reset; see the cache comment at the top of this module.
+    """
+    cache_key = (
+        "resolved",
+        _normalize_calculator_name(calculator_name),
+        tuple(_normalize_species(species)),
+    )
+    resolved = _cache_get(cache_key)
+    if resolved is None:
+        resolved = _resolve_uncached_calculator(calculator_name, species)
+        if not resolved[2]:
+            resolved = _cache_put(cache_key, resolved)
+    calculator, calculator_used, errors = resolved
+    return calculator, calculator_used, list(errors)
+
+
+def _resolve_uncached_calculator(
+    calculator_name: str,
+    species: Sequence[str] | None,
+) -> tuple["ORBCalculator | NequixCalculator | KIMCalculator", str, list[str]]:
     calculator_key = _normalize_calculator_name(calculator_name)
     available_candidates = ("kim", "orb", "nequix")
     if calculator_key == "auto":
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import os
 
 os.environ.setdefault("JAX_PLUGINS", "")
@@ -148,6 +149,7 @@ TOOL_NAMES = [
     "analyze_structure_workflow",
     "write_structure_workflow",
     "optimize_structure_workflow",
+    "batch_optimize_structure_workflow",
     "single_point_workflow",
     "run_md_workflow",
     "analyze_trajectory_workflow",
@@ -213,7 +215,23 @@ async def handle_server_card(request: Request) -> JSONResponse:
 async def handle_artifact_download(request: Request):
     """Serve generated artifacts with disposition based on media type."""
     artifact_id = request.path_params["artifact_id"]
+    pending = artifact_store.pending_write(artifact_id)
+    if pending is not None:
+        # Wait for the background write without blocking the event loop. The
+        # store's own done-callback runs first and records any failure, which
+        # write_error reports below.
+        waiter = asyncio.wrap_future(pending)
+        await asyncio.wait([waiter])
+        if not waiter.cancelled():
+            waiter.exception()
     record = artifact_store.get(artifact_id)
+    if record is not None:
+        write_error = artifact_store.write_error(record)
+        if write_error is not None:
+            return JSONResponse(
+                {"error": "artifact_write_failed", "artifact_id": artifact_id, "detail": write_error},
+                status_code=500,
+            )
     if record is None or not record.filepath.exists():
         return JSONResponse({"error": "artifact_not_found", "artifact_id": artifact_id}, status_code=404)
 
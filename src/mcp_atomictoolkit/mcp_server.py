@@ -25,6 +25,8 @@ from mcp_atomictoolkit.workflows.core import (
     analyze_structure_workflow as analyze_structure_workflow_impl,
     analyze_trajectory_workflow as analyze_trajectory_workflow_impl,
     autocorrelation_workflow as autocorrelation_workflow_impl,
+    batch_optimize_structure_workflow as batch_optimize_structure_workflow_impl,
+    batch_single_point_workflow as batch_single_point_workflow_impl,
     build_structure_workflow as build_structure_workflow_impl,
     optimize_structure_workflow as optimize_structure_workflow_impl,
     run_md_workflow as run_md_workflow_impl,
@@ -171,7 +173,7 @@ def _collect_resource_snapshot() -> Dict[str, Any]:
     return snapshot
 
 
-def _run_tool(tool_name: str, impl: Callable[..., Dict], **kwargs: Any) -> Dict:
+def _run_tool(tool_name: str, impl: Callable[..., Any], **kwargs: Any) -> Dict:
     start = perf_counter()
     compact_args = _compact_kwargs(kwargs)
     logger.info("Tool %s called with args=%s", tool_name, compact_args)
@@ -191,6 +193,9 @@ def _run_tool(tool_name: str, impl: Callable[..., Dict], **kwargs: Any) -> Dict:
 
     elapsed_ms = (perf_counter() - start) * 1000
     logger.info("Tool %s succeeded in %.1f ms", tool_name, elapsed_ms)
+    # Typed workflow results are only turned into dicts at the MCP boundary.
+    if hasattr(result, "as_dict"):
+        result = result.as_dict()
     return with_downloadable_artifacts(result)
 
 
@@ -206,6 +211,9 @@ async def build_structure_workflow(
     output_filepath: str = "structure.extxyz",
     output_format: Optional[str] = None,
     builder_kwargs: Optional[Dict] = None,
+    compute_symmetry: bool = True,
+    symmetry_precision: float = 0.01,
+    seed: Optional[int] = None,
 ) -> Dict:
     """Build an atomic structure and return metadata.
 
@@ -222,6 +230,9 @@ async def build_structure_workflow(
         output_filepath: Output file path for the built structure
         output_format: Output file format (optional)
         builder_kwargs: Extra builder-specific parameters
+        compute_symmetry: Run spglib to report spacegroup/crystal system/point group
+        symmetry_precision: Symmetry tolerance in Angstrom
+        seed: Random seed for reproducible amorphous/liquid structures
 
     Returns:
         Dict containing structure metadata
@@ -239,6 +250,9 @@ async def build_structure_workflow(
         output_filepath=output_filepath,
         output_format=output_format,
         builder_kwargs=builder_kwargs,
+        compute_symmetry=compute_symmetry,
+        symmetry_precision=symmetry_precision,
+        seed=seed,
     )
 
 
@@ -319,6 +333,12 @@ async def optimize_structure_workflow(
     constraints: Optional[Dict] = None,
     maxstep: float = 0.04,
     alpha: float = 70.0,
+    optimizer: Optional[str] = None,
+    warmup_steps: int = 10,
+    warmup_fmax: float = 1.0,
+    patience: int = 20,
+    energy_tol: float = 1e-4,
+    async_write: bool = False,
 ) -> Dict:
     """Optimize structure using MLIP and return metadata.
 
@@ -333,6 +353,15 @@ async def optimize_structure_workflow(
         constraints: Constraint settings (fixed atoms/cell/bonds)
         maxstep: Maximum step size for the optimizer (Angstrom)
         alpha: BFGS damping parameter
+        optimizer: Optimizer name ('lbfgs', 'lbfgs_linesearch', 'bfgs',
+            'bfgs_linesearch', 'fire', or 'scipy_lbfgsb'). Defaults to an
+            L-BFGS variant chosen for the structure.
+        warmup_steps: Maximum MDMin steps run before the main optimizer
+        warmup_fmax: Force threshold that ends the MDMin warm-up
+        patience: Steps without energy decrease before stopping early
+        energy_tol: Minimum energy decrease (eV) counted as progress
+        async_write: Write the output file in the background and return
+            immediately; artifact downloads wait for the write to finish
 
     Returns:
         Dict containing optimized structure metadata
@@ -350,6 +379,55 @@ async def optimize_structure_workflow(
         constraints=constraints,
         maxstep=maxstep,
         alpha=alpha,
+        optimizer=optimizer,
+        warmup_steps=warmup_steps,
+        warmup_fmax=warmup_fmax,
+        patience=patience,
+        energy_tol=energy_tol,
+        async_write=async_write,
+    )
+
+
+@mcp.tool(task=TaskConfig(mode="optional"))
+async def batch_optimize_structure_workflow(
+    input_filepaths: List[str],
+    input_format: Optional[str] = None,
+    output_dir: str = "optimization_outputs",
+    output_format: str = "extxyz",
+    calculator_name: str = DEFAULT_CALCULATOR_NAME,
+    max_steps: int = 50,
+    fmax: float = 0.1,
+    constraints: Optional[Dict] = None,
+    optimizer: Optional[str] = None,
+    warmup_steps: int = 10,
+    warmup_fmax: float = 1.0,
+    patience: int = 20,
+    energy_tol: float = 1e-4,
+    n_jobs: int = 1,
+) -> Dict:
+    """Optimize several independent structures and return per-structure metadata.
+
+    Results are written to ``output_dir`` as ``optimized_<index>.<output_format>``.
+    ``n_jobs`` > 1 relaxes structures in that many worker processes, each of
+    which loads its own calculator (default 1: one after another).
+    """
+    return _run_tool(
+        "batch_optimize_structure_workflow",
+        batch_optimize_structure_workflow_impl,
+        input_filepaths=input_filepaths,
+        input_format=input_format,
+        output_dir=output_dir,
+        output_format=output_format,
+        calculator_name=calculator_name,
+        max_steps=max_steps,
+        fmax=fmax,
+        constraints=constraints,
+        optimizer=optimizer,
+        warmup_steps=warmup_steps,
+        warmup_fmax=warmup_fmax,
+        patience=patience,
+        energy_tol=energy_tol,
+        n_jobs=n_jobs,
     )
 
 
@@ -358,14 +436,53 @@ async def single_point_workflow(
     input_filepath: str,
     input_format: Optional[str] = None,
     calculator_name: str = DEFAULT_CALCULATOR_NAME,
+    compute_stress: bool = False,
+    forces_as_artifact: bool = True,
+    forces_filepath: Optional[str] = None,
+    output_dir: str = "analysis_outputs/single_point",
 ) -> Dict:
-    """Compute single-point energy, forces, and stress (if periodic)."""
+    """Compute single-point energy, forces, and optionally stress (if periodic).
+
+    By default forces are written to ``forces_filepath`` (``.npy``; a uniquely
+    named file in ``output_dir`` when omitted) and returned as a downloadable
+    artifact with its ID, shape and max-norm summaries.
+    """
     return _run_tool(
         "single_point_workflow",
         single_point_workflow_impl,
         input_filepath=input_filepath,
         input_format=input_format,
         calculator_name=calculator_name,
+        compute_stress=compute_stress,
+        forces_as_artifact=forces_as_artifact,
+        forces_filepath=forces_filepath,
+        output_dir=output_dir,
+    )
+
+
+@mcp.tool(task=TaskConfig(mode="optional"))
+async def batch_single_point_workflow(
+    input_filepaths: List[str],
+    input_format: Optional[str] = None,
+    calculator_name: str = DEFAULT_CALCULATOR_NAME,
+    compute_stress: bool = False,
+    forces_as_artifact: bool = True,
+    output_dir: str = "analysis_outputs/single_point",
+) -> Dict:
+    """Compute single-point energy and forces for several structures at once.
+
+    The calculator is resolved once for all structures; per-structure forces
+    are written to ``output_dir`` as uniquely named ``.npy`` artifacts by default.
+    """
+    return _run_tool(
+        "batch_single_point_workflow",
+        batch_single_point_workflow_impl,
+        input_filepaths=input_filepaths,
+        input_format=input_format,
+        calculator_name=calculator_name,
+        compute_stress=compute_stress,
+        forces_as_artifact=forces_as_artifact,
+        output_dir=output_dir,
     )
 
 
@@ -423,8 +540,15 @@ async def analyze_trajectory_workflow(
     rdf_bins: int = 200,
     rdf_stride: int = 1,
     plot_formats: Optional[List[str]] = None,
+    n_jobs: int = 1,
+    backend: str = "cpu",
 ) -> Dict:
-    """Analyze a trajectory and return analysis artifacts."""
+    """Analyze a trajectory and return analysis artifacts.
+
+    ``n_jobs`` sets the number of threads used for per-frame RDFs (default 1;
+    -1 uses every CPU).
+    ``backend="cuda"`` computes RDFs of non-periodic frames on the GPU (needs CuPy).
+    """
     return _run_tool(
         "analyze_trajectory_workflow",
         analyze_trajectory_workflow_impl,
@@ -436,6 +560,8 @@ async def analyze_trajectory_workflow(
         rdf_bins=rdf_bins,
         rdf_stride=rdf_stride,
         plot_formats=plot_formats,
+        n_jobs=n_jobs,
+        backend=backend,
     )
 
 
@@ -1,14 +1,87 @@
 """Structure optimization using MLIPs (KIM, Orb, and Nequix)."""
 
-from typing import Any, Dict, List, Optional, Tuple
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 from ase import Atoms
 from ase.constraints import FixAtoms, FixBondLength, FixBondLengths
-from ase.optimize import BFGS
+from ase.optimize import (
+    BFGS,
+    FIRE,
+    LBFGS,
+    BFGSLineSearch,
+    LBFGSLineSearch,
+    MDMin,
+)
+from ase.optimize.optimize import Optimizer
+from scipy.optimize import OptimizeResult, minimize
 
 from mcp_atomictoolkit.calculators import DEFAULT_CALCULATOR_NAME, resolve_calculator
 
+DEFAULT_OPTIMIZER_NAME = "lbfgs_linesearch"
+SCIPY_OPTIMIZER_NAME = "scipy_lbfgsb"
+SCIPY_MAX_ATOMS = 30
+
+
+def _normalize_optimizer_name(optimizer_name: str) -> str:
+    """Return canonical optimizer key, accepting ASE class names and dashes."""
+    return optimizer_name.strip().lower().replace("-", "_")
+
+
+def build_optimizer(
+    atoms: Atoms, optimizer_name: str = DEFAULT_OPTIMIZER_NAME, **kwargs
+) -> Optimizer:
+    """Instantiate an ASE optimizer by name.
+
+    Args:
+        atoms: Structure to optimize (with calculator attached)
+        optimizer_name: One of 'bfgs', 'lbfgs', 'lbfgs_linesearch',
+            'bfgs_linesearch', or 'fire'
+        **kwargs: Optimizer parameters (maxstep, alpha, memory) and optional
+            ``logfile``/``trajectory`` outputs (both disabled by default)
+
+    Returns:
+        Configured ASE optimizer
+    """
+    key = _normalize_optimizer_name(optimizer_name)
+    maxstep = kwargs.get("maxstep", 0.04)
+    alpha = kwargs.get("alpha", 70.0)
+    # Per-step logging is off unless a logfile is requested explicitly.
+    io_kwargs = {
+        "logfile": kwargs.get("logfile"),
+        "trajectory": kwargs.get("trajectory"),
+    }
+    if key == "bfgs":
+        return BFGS(atoms, maxstep=maxstep, alpha=alpha, **io_kwargs)
+    if key == "lbfgs":
+        return LBFGS(
+            atoms,
+            maxstep=maxstep,
+            alpha=alpha,
+            memory=kwargs.get("memory", 100),
+            **io_kwargs,
+        )
+    if key in {"lbfgs_linesearch", "lbfgslinesearch"}:
+        return LBFGSLineSearch(
+            atoms,
+            maxstep=maxstep,
+            alpha=alpha,
+            memory=kwargs.get("memory", 100),
+            **io_kwargs,
+        )
+    if key in {"bfgs_linesearch", "bfgslinesearch"}:
+        return BFGSLineSearch(atoms, maxstep=maxstep, alpha=alpha, **io_kwargs)
+    if key == "fire":
+        return FIRE(atoms, maxstep=maxstep, **io_kwargs)
+    raise ValueError(
+        f"Unknown optimizer: {optimizer_name}. Use 'bfgs', 'lbfgs', "
+        "'lbfgs_linesearch', 'bfgs_linesearch', or 'fire'."
+    )
+
 
 def apply_constraints(atoms: Atoms, constraints: Optional[Dict[str, Any]]) -> None:
     """Apply ASE constraints (fixed atoms, fixed bonds, fixed cell metadata)."""
@@ -23,15 +96,18 @@ def apply_constraints(atoms: Atoms, constraints: Optional[Dict[str, Any]]) -> No
 
     fixed_bonds = constraints.get("fixed_bonds") or constraints.get("bonds")
     if fixed_bonds:
-        pairs: List[Tuple[int, int]] = []
-        for bond in fixed_bonds:
-            if isinstance(bond, dict):
-                indices = bond.get("indices") or bond.get("pair")
-                if indices is None:
-                    indices = (bond.get("a"), bond.get("b"))
-                pairs.append(tuple(indices))
-            else:
-                pairs.append(tuple(bond))
+        pairs: List[Tuple[int, int]] = [
+            tuple(
+                (
+                    bond.get("indices")
+                    or bond.get("pair")
+                    or (bond.get("a"), bond.get("b"))
+                )
+                if isinstance(bond, dict)
+                else bond
+            )
+            for bond in fixed_bonds
+        ]
         if len(pairs) == 1:
             new_constraints.append(FixBondLength(*pairs[0]))
         else:
@@ -49,6 +125,154 @@ def apply_constraints(atoms: Atoms, constraints: Optional[Dict[str, Any]]) -> No
         atoms.info["fixed_cell"] = bool(constraints["fixed_cell"])
 
 
+def _max_force(forces: np.ndarray) -> float:
+    """Return the largest per-atom force norm."""
+    return float(np.linalg.norm(forces, axis=1).max())
+
+
+def _use_scipy_optimizer(atoms: Atoms, optimizer_name: Optional[str]) -> bool:
+    if optimizer_name is not None:
+        return _normalize_optimizer_name(optimizer_name) == SCIPY_OPTIMIZER_NAME
+    # Small isolated molecules relax in fewer force calls with SciPy's
+    # L-BFGS-B; constrained systems stay on ASE, which projects constraints.
+    return not atoms.pbc.any() and len(atoms) < SCIPY_MAX_ATOMS and not atoms.constraints
+
+
+def _scipy_optimize(
+    atoms: Atoms,
+    fmax: float,
+    max_steps: int,
+    patience: Optional[int] = None,
+    energy_tol: float = 1e-4,
+) -> Tuple[OptimizeResult, bool]:
+    """Relax atomic positions in place with SciPy's L-BFGS-B.
+
+    Args:
+        atoms: Structure with an attached calculator
+        fmax: Force convergence criterion
+        max_steps: Maximum number of L-BFGS-B iterations
+        patience: Consecutive iterations without an energy decrease larger
+            than ``energy_tol`` before halting; None disables the check
+        energy_tol: Minimum energy decrease (eV) that resets the counter
+
+    Returns:
+        SciPy's result and whether the patience criterion halted the run
+    """
+
+    def energy_and_gradient(x: np.ndarray) -> Tuple[float, np.ndarray]:
+        atoms.set_positions(x.reshape(-1, 3))
+        return atoms.get_potential_energy(), -atoms.get_forces().ravel()
+
+    # Progress is measured from the starting energy, as in _run_with_patience;
+    # the calculator caches it for L-BFGS-B's first evaluation at x0.
+    best_energy = atoms.get_potential_energy() if patience else np.inf
+    stalled = 0
+    plateaued = False
+
+    def stop_on_plateau(intermediate_result: OptimizeResult) -> None:
+        nonlocal best_energy, stalled, plateaued
+        if not patience:
+            return
+        if intermediate_result.fun < best_energy - energy_tol:
+            best_energy = intermediate_result.fun
+            stalled = 0
+        else:
+            stalled += 1
+        if stalled >= patience:
+            plateaued = True
+            raise StopIteration
+
+    # gtol bounds the largest gradient component; dividing by sqrt(3) keeps
+    # the per-atom force norm below fmax at convergence.
+    result = minimize(
+        energy_and_gradient,
+        atoms.get_positions().ravel(),
+        jac=True,
+        method="L-BFGS-B",
+        options={"gtol": fmax / np.sqrt(3), "maxiter": max_steps},
+        callback=stop_on_plateau,
+    )
+    atoms.set_positions(result.x.reshape(-1, 3))
+    return result, plateaued
+
+
+def _scipy_stop_reason(result: OptimizeResult, converged: bool, plateaued: bool) -> str:
+    """Map an L-BFGS-B result onto an ``optimization_stop_reason``."""
+    if converged:
+        return "fmax"
+    if plateaued:
+        return "patience"
+    if result.status == 1:
+        return "max_steps"
+    if result.status == 0:
+        # SciPy's own relative energy reduction test (ftol) ended the run
+        # before the forces reached fmax.
+        return "ftol"
+    message = str(result.message).upper()
+    if "ABNORMAL" in message or "LNSRCH" in message:
+        return "line_search"
+    return "scipy_error"
+
+
+def _warm_up(atoms: Atoms, warmup_steps: int, warmup_fmax: float) -> int:
+    """Run MDMin until forces drop below ``warmup_fmax``.
+
+    Quasi-Newton Hessian updates degrade under the large, noisy forces of
+    freshly built structures, so those are first damped with MDMin.
+
+    Args:
+        atoms: Structure with an attached calculator
+        warmup_steps: Maximum number of MDMin steps; 0 disables the warm-up
+        warmup_fmax: Force threshold at which the warm-up hands off
+
+    Returns:
+        Number of warm-up steps taken
+    """
+    if warmup_steps <= 0:
+        return 0
+    warmup = MDMin(atoms, logfile=None)
+    warmup.run(fmax=warmup_fmax, steps=warmup_steps)
+    return warmup.nsteps
+
+
+def _run_with_patience(
+    optimizer: Optimizer,
+    atoms: Atoms,
+    fmax: float,
+    steps: int,
+    patience: Optional[int],
+    energy_tol: float,
+) -> bool:
+    """Run an optimizer, stopping early once the energy stops decreasing.
+
+    Args:
+        optimizer: Optimizer attached to ``atoms``
+        atoms: Structure being relaxed
+        fmax: Force convergence criterion
+        steps: Maximum number of optimizer steps
+        patience: Consecutive steps without an energy decrease larger than
+            ``energy_tol`` before giving up; None disables the check
+        energy_tol: Minimum energy decrease (eV) that resets the counter
+
+    Returns:
+        True if the run was stopped by the patience criterion
+    """
+    best_energy = np.inf
+    stalled = 0
+    for converged in optimizer.irun(fmax=fmax, steps=steps):
+        if converged or not patience:
+            continue
+        energy = atoms.get_potential_energy()
+        if energy < best_energy - energy_tol:
+            best_energy = energy
+            stalled = 0
+        else:
+            stalled += 1
+        if stalled >= patience:
+            return True
+    return False
+
+
 def optimize_structure(
     structure: Atoms,
     calculator_name: str = DEFAULT_CALCULATOR_NAME,
@@ -65,7 +289,21 @@ def optimize_structure(
         max_steps: Maximum optimization steps
         fmax: Force convergence criterion
         constraints: Constraint settings (fixed atoms/cell/bonds)
-        **kwargs: Additional optimization parameters
+        **kwargs: Additional optimization parameters (optimizer, maxstep, alpha,
+            memory). Without an explicit ``optimizer``, unconstrained
+            non-periodic structures under 30 atoms use SciPy's L-BFGS-B
+            ('scipy_lbfgsb') and everything else 'lbfgs_linesearch'. With
+            ``optimizer='bfgs'``, ``initial_hessian`` warm-starts the run from
+            a previous Hessian and ``return_hessian=True`` stores the final one
+            in ``info['_bfgs_H']`` (pop it before writing extxyz files).
+            ``warmup_steps``/``warmup_fmax`` run an MDMin phase first until
+            forces fall below ``warmup_fmax``; its steps count towards
+            ``max_steps`` and are reported as ``info['warmup_steps_used']``.
+            ``patience`` stops the run after that many steps without an energy
+            decrease larger than ``energy_tol`` (eV, default 1e-4). The cause
+            of termination is recorded in ``info['optimization_stop_reason']``
+            ('fmax', 'patience' or 'max_steps'; the SciPy path may also report
+            'ftol', 'line_search' or 'scipy_error').
 
     Returns:
         Optimized structure
@@ -86,27 +324,146 @@ def optimize_structure(
     if calculator_errors:
         atoms.info["calculator_fallbacks"] = calculator_errors
 
-    optimizer = BFGS(
-        atoms, maxstep=kwargs.get("maxstep", 0.04), alpha=kwargs.get("alpha", 70.0)
-    )
+    use_scipy = _use_scipy_optimizer(atoms, kwargs.get("optimizer"))
+    optimizer = None
+    if not use_scipy:
+        optimizer = build_optimizer(
+            atoms, kwargs.get("optimizer") or DEFAULT_OPTIMIZER_NAME, **kwargs
+        )
+    is_bfgs = isinstance(optimizer, BFGS)
+    initial_hessian = kwargs.get("initial_hessian")
+    if is_bfgs and initial_hessian is not None:
+        initial_hessian = np.asarray(initial_hessian, dtype=float)
+        # Warm starts only apply when the degrees of freedom match.
+        if initial_hessian.shape == optimizer.H0.shape:
+            optimizer.H0 = initial_hessian
 
     try:
-        optimizer.run(fmax=fmax, steps=max_steps)
-        converged = optimizer.converged()
-        if converged:
-            atoms.info["optimization_converged"] = True
-            atoms.info["optimization_steps"] = optimizer.nsteps
-            atoms.info["optimization_fmax"] = max(
-                np.linalg.norm(atoms.get_forces(), axis=1)
+        warmup_used = _warm_up(
+            atoms, kwargs.get("warmup_steps", 0), kwargs.get("warmup_fmax", 1.0)
+        )
+        remaining_steps = max(max_steps - warmup_used, 0)
+        if use_scipy:
+            result, plateaued = _scipy_optimize(
+                atoms,
+                fmax,
+                remaining_steps,
+                kwargs.get("patience"),
+                kwargs.get("energy_tol", 1e-4),
             )
+            steps = int(result.nit)
+            forces = atoms.get_forces()
+            converged = _max_force(forces) < fmax
+            stop_reason = _scipy_stop_reason(result, converged, plateaued)
         else:
-            atoms.info["optimization_converged"] = False
-            atoms.info["optimization_steps"] = max_steps
-            atoms.info["optimization_fmax"] = max(
-                np.linalg.norm(atoms.get_forces(), axis=1)
+            plateaued = _run_with_patience(
+                optimizer,
+                atoms,
+                fmax,
+                remaining_steps,
+                kwargs.get("patience"),
+                kwargs.get("energy_tol", 1e-4),
             )
+            if is_bfgs and kwargs.get("return_hessian") and optimizer.state is not None:
+                atoms.info["_bfgs_H"] = optimizer.H
+            steps = optimizer.nsteps
+            # Forces of the final configuration are already cached on the
+            # calculator, so they are read once and reused for both checks.
+            forces = atoms.get_forces()
+            converged = optimizer.converged(forces)
+            if converged:
+                stop_reason = "fmax"
+            elif plateaued:
+                stop_reason = "patience"
+            else:
+                stop_reason = "max_steps"
+        atoms.info["optimization_converged"] = bool(converged)
+        atoms.info["optimization_steps"] = warmup_used + steps
+        atoms.info["optimization_fmax"] = _max_force(forces)
+        atoms.info["optimization_stop_reason"] = stop_reason
+        atoms.info["warmup_steps_used"] = warmup_used
     except Exception as e:
         atoms.info["optimization_error"] = str(e)
         atoms.info["optimization_converged"] = False
 
     return atoms
+
+
+def _init_parallel_worker() -> None:
+    """Pin BLAS/OpenMP pools to one thread so workers do not oversubscribe."""
+    try:
+        from threadpoolctl import threadpool_limits
+    except ImportError:
+        return
+    threadpool_limits(limits=1)
+
+
+def _optimize_detached(structure: Atoms, **kwargs) -> Atoms:
+    """Optimize in a worker process and return Atoms that pickle cheaply.
+
+    Calculators often hold unpicklable state (closures, KIM handles) or a whole
+    model, so the final energy and forces are kept on the Atoms and the
+    calculator itself stays in the worker.
+    """
+    atoms = optimize_structure(structure, **kwargs)
+    results = getattr(atoms.calc, "results", {})
+    if "energy" in results:
+        atoms.info["energy"] = float(results["energy"])
+    if "forces" in results:
+        atoms.arrays["forces"] = np.array(results["forces"])
+    atoms.calc = None
+    return atoms
+
+
+def optimize_structures_parallel(
+    structures: Sequence[Atoms],
+    calculator_name: str = DEFAULT_CALCULATOR_NAME,
+    max_steps: int = 50,
+    fmax: float = 0.1,
+    constraints: Optional[Dict[str, Any]] = None,
+    n_jobs: Optional[int] = None,
+    **kwargs,
+) -> List[Atoms]:
+    """Optimize independent structures concurrently in worker processes.
+
+    Workers are spawned (not forked) so each one owns its JAX/XLA runtime and
+    calculator cache. Returned structures carry no calculator; their final
+    energy is in ``info["energy"]`` and forces in ``arrays["forces"]``.
+
+    Args:
+        structures: Input structures
+        calculator_name: Type of MLIP ('auto', 'kim', 'nequix', or 'orb'). Defaults to auto.
+        max_steps: Maximum optimization steps per structure
+        fmax: Force convergence criterion
+        constraints: Constraint settings applied to every structure
+        n_jobs: Number of worker processes (defaults to the CPU count); 1 runs
+            serially in the calling process
+        **kwargs: Additional optimization parameters forwarded to
+            ``optimize_structure``
+
+    Returns:
+        Optimized structures, in input order
+    """
+    if n_jobs is None:
+        n_jobs = os.cpu_count() or 1
+    if n_jobs <= 0:
+        raise ValueError("n_jobs must be a positive integer")
+
+    optimize = partial(
+        _optimize_detached,
+        calculator_name=calculator_name,
+        max_steps=max_steps,
+        fmax=fmax,
+        constraints=constraints,
+        **kwargs,
+    )
+    n_jobs = min(n_jobs, len(structures))
+    if n_jobs <= 1:
+        return [optimize(structure) for structure in structures]
+
+    with ProcessPoolExecutor(
+        max_workers=n_jobs,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_parallel_worker,
+    ) as executor:
+        return list(executor.map(optimize, structures))
@@ -1,5 +1,6 @@
 """Core structure manipulation operations using ASE."""
 
+from functools import lru_cache
 from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 import numpy as np
@@ -28,18 +29,14 @@ def _resolve_cell(
 def _assign_species(formula: str, num_atoms: int) -> List[str]:
     composition = Composition(formula)
     fractions = composition.fractional_composition.get_el_amt_dict()
-    symbols: List[str] = []
-    remaining = num_atoms
-    for idx, (element, fraction) in enumerate(fractions.items()):
-        if idx == len(fractions) - 1:
-            count = remaining
-        else:
-            count = max(1, int(round(fraction * num_atoms)))
-        symbols.extend([element] * count)
-        remaining -= count
-    if remaining > 0:
-        symbols.extend([list(fractions.keys())[-1]] * remaining)
-    return symbols
+    elements = np.array(list(fractions.keys()))
+    counts = np.empty(len(elements), dtype=int)
+    counts[:-1] = np.maximum(
+        1, np.rint(np.fromiter(fractions.values(), dtype=float)[:-1] * num_atoms)
+    )
+    # The last element absorbs the rounding residual so the total matches.
+    counts[-1] = max(0, num_atoms - int(counts[:-1].sum()))
+    return np.repeat(elements, counts).tolist()
 
 
 def _random_packed_structure(
@@ -50,10 +47,16 @@ def _random_packed_structure(
     relax: bool,
     relax_steps: int,
     relax_fmax: float,
+    rng: np.random.Generator,
 ) -> Atoms:
     symbols = _assign_species(formula, num_atoms)
-    frac_positions = np.random.rand(num_atoms, 3)
-    positions = frac_positions @ cell_matrix
+    frac_positions = rng.random((num_atoms, 3))
+    diagonal = np.diagonal(cell_matrix)
+    if np.count_nonzero(cell_matrix) == np.count_nonzero(diagonal):
+        # Orthorhombic boxes only need a per-axis scale, not a full matmul.
+        positions = frac_positions * diagonal
+    else:
+        positions = frac_positions @ cell_matrix
     atoms = Atoms(symbols=symbols, positions=positions, cell=cell_matrix, pbc=pbc)
     if relax:
         atoms.calc = EMT()
@@ -75,14 +78,14 @@ def _stack_grains(
         raise ValueError("Grain cell axis length must be non-zero")
     axis_unit = axis_vector / axis_length
     translation = axis_vector + axis_unit * gap
-    grain_b = grain_b.copy()
-    grain_b.translate(translation)
-    combined = grain_a + grain_b
     cell = grain_a.cell.array.copy()
     cell[axis] = cell[axis] + grain_b.cell.array[axis] + axis_unit * gap
-    combined.set_cell(cell)
-    combined.pbc = pbc
-    return combined
+    return Atoms(
+        numbers=np.concatenate((grain_a.numbers, grain_b.numbers)),
+        positions=np.vstack((grain_a.positions, grain_b.positions + translation)),
+        cell=cell,
+        pbc=pbc,
+    )
 
 
 def create_structure(
@@ -107,7 +110,9 @@ def create_structure(
         pbc: Periodic boundary condition flags
         cell: Explicit cell matrix (3x3)
         cell_size: Cell lengths (a, b, c) if cell not provided
-        **kwargs: Additional parameters for specific structure types
+        **kwargs: Additional parameters for specific structure types; the
+            random 'amorphous'/'liquid' builders accept ``seed`` (an int or a
+            ``numpy.random.Generator``) for reproducible positions
 
     Returns:
         ASE Atoms object
@@ -163,6 +168,7 @@ def create_structure(
             relax=bool(kwargs.get("relax", False)),
             relax_steps=int(kwargs.get("relax_steps", 100)),
             relax_fmax=float(kwargs.get("relax_fmax", 0.1)),
+            rng=np.random.default_rng(kwargs.get("seed")),
         )
     elif structure_type == "bicrystal":
         grain_size = kwargs.get("grain_size", (4, 4, 4))
@@ -186,9 +192,10 @@ def create_structure(
         base = bulk(
             formula, crystal_system, a=lattice_constant, cubic=use_cubic
         )
+        supercell = base * grain_size
         grains: List[Atoms] = []
         for idx in range(num_grains):
-            grain = base * grain_size
+            grain = supercell.copy()
             angle = float(kwargs.get("rotation_angle", 15.0)) * (idx + 1)
             grain.rotate(angle, (0, 0, 1), rotate_cell=True)
             shift = np.array(
@@ -200,9 +207,10 @@ def create_structure(
             )
             grain.translate(shift)
             grains.append(grain)
-        atoms = grains[0]
-        for grain in grains[1:]:
-            atoms += grain
+        atoms = Atoms(
+            numbers=np.concatenate([grain.numbers for grain in grains]),
+            positions=np.concatenate([grain.positions for grain in grains], axis=0),
+        )
         cell_matrix = _resolve_cell(
             cell, cell_size, lattice_constant * grain_size[0] * grid
         )
@@ -234,9 +242,13 @@ def manipulate_structure(atoms: Atoms, operation: str, **kwargs) -> Atoms:
     elif operation == "translate":
         atoms.translate(kwargs.get("vector", [0, 0, 1]))
     elif operation == "strain":
-        strain = kwargs.get("strain", 0.02)
-        atoms.cell *= 1 + strain
-        atoms.wrap()
+        # Isotropic strain scales positions with the cell, so fractional
+        # coordinates are unchanged and no wrap (matrix solve) is needed.
+        factor = 1 + kwargs.get("strain", 0.02)
+        atoms.positions *= factor
+        atoms.set_cell(atoms.cell.array * factor)
+        if kwargs.get("wrap", False):
+            atoms.wrap()
     elif operation == "supercell":
         atoms = atoms * kwargs.get("size", (2, 2, 2))
     else:
@@ -245,29 +257,52 @@ def manipulate_structure(atoms: Atoms, operation: str, **kwargs) -> Atoms:
     return atoms
 
 
-def get_structure_info(atoms: Atoms) -> Dict:
+@lru_cache(maxsize=256)
+def _symmetry_summary(
+    lattice_bytes: bytes,
+    numbers_bytes: bytes,
+    coords_bytes: bytes,
+    symprec: float = 0.01,
+) -> Tuple[str, str, str]:
+    """Run spglib (via pymatgen) once per distinct periodic structure."""
+    lattice = np.frombuffer(lattice_bytes).reshape(3, 3)
+    numbers = np.frombuffer(numbers_bytes, dtype=np.int64).tolist()
+    coords = np.frombuffer(coords_bytes).reshape(-1, 3)
+    analyzer = SpacegroupAnalyzer(Structure(lattice, numbers, coords), symprec=symprec)
+    return (
+        analyzer.get_space_group_symbol(),
+        analyzer.get_crystal_system(),
+        analyzer.get_point_group_symbol(),
+    )
+
+
+def get_structure_info(
+    atoms: Atoms, include_symmetry: bool = True, symprec: float = 0.01
+) -> Dict:
     """Get detailed information about structure.
 
     Args:
         atoms: Input structure
+        include_symmetry: Run the spglib symmetry analysis for periodic cells
+        symprec: Distance tolerance (Angstrom) for the symmetry search
 
     Returns:
         Dictionary with structure information
     """
-    # Convert to pymatgen structure for analysis
-    lattice = atoms.cell.array
-    species = atoms.get_chemical_symbols()
-    coords = atoms.get_scaled_positions()
-
     spacegroup = None
     crystal_system = None
     point_group = None
-    if all(atoms.pbc):
-        structure = Structure(lattice, species, coords)
-        analyzer = SpacegroupAnalyzer(structure)
-        spacegroup = analyzer.get_space_group_symbol()
-        crystal_system = analyzer.get_crystal_system()
-        point_group = analyzer.get_point_group_symbol()
+    if include_symmetry and all(atoms.pbc):
+        # Key the cache on raw buffers: atomic numbers avoid building a list
+        # of symbol strings, and the cell array is used without copying.
+        lattice = np.ascontiguousarray(atoms.cell.array, dtype=np.float64)
+        numbers = np.ascontiguousarray(atoms.numbers, dtype=np.int64)
+        # Rounding absorbs floating-point noise from no-op operations (e.g. a
+        # lattice translation followed by a wrap) so they hit the cache.
+        coords = np.round(atoms.get_scaled_positions(), 6) % 1.0
+        spacegroup, crystal_system, point_group = _symmetry_summary(
+            lattice.tobytes(), numbers.tobytes(), coords.tobytes(), symprec
+        )
 
     return {
         "formula": atoms.get_chemical_formula(),
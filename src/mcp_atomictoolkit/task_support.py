@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -70,13 +71,10 @@ async def handle_tool_as_task(
         )
 
     task_key = build_task_key(session_id, server_task_id, "tool", tool_name)
+    # Resolved per submission: FastMCP has no invalidation hook that covers
+    # every way a tool list can change (e.g. proxy or remote mounts).
     tool = await server.get_tool(tool_name)
-
-    ttl_seconds = None
-    if docket.execution_ttl:
-        ttl_seconds = int(
-            docket.execution_ttl.total_seconds() + TASK_MAPPING_TTL_BUFFER_SECONDS
-        )
+    ttl_seconds = _mapping_ttl_seconds(docket)
 
     task_ttl_ms = task_meta.get("ttl") if task_meta else None
 
@@ -267,22 +265,24 @@ async def tasks_list_handler(server: FastMCP, params: dict[str, Any]) -> ListTas
             task_ids = []
 
     if task_ids:
-        for task_id_bytes in task_ids:
-            task_id = _decode(task_id_bytes)
-            try:
-                task_record = await _load_task_record(docket, ctx.session_id, task_id)
-            except McpError:
-                continue
-
-            execution = await docket.get_execution(task_record.task_key)
-            if execution is None:
-                continue
-
-            await execution.sync()
+        task_records = await _load_task_records(
+            docket, ctx.session_id, [_decode(task_id) for task_id in task_ids]
+        )
+        executions = await asyncio.gather(
+            *(docket.get_execution(record.task_key) for record in task_records)
+        )
+        listed = [
+            (record, execution)
+            for record, execution in zip(task_records, executions)
+            if execution is not None
+        ]
+        await asyncio.gather(*(execution.sync() for _record, execution in listed))
+
+        for task_record, execution in listed:
             status = DOCKET_TO_MCP_STATE.get(execution.state, "failed")
             tasks.append(
                 Task(
-                    taskId=task_id,
+                    taskId=task_record.task_id,
                     status=status,  # type: ignore[arg-type]
                     createdAt=task_record.created_at,
                     lastUpdatedAt=datetime.now(timezone.utc),
@@ -349,6 +349,12 @@ async def tasks_cancel_handler(server: FastMCP, params: dict[str, Any]) -> Cance
     )
 
 
+def _mapping_ttl_seconds(docket) -> Optional[int]:
+    if not docket.execution_ttl:
+        return None
+    return int(docket.execution_ttl.total_seconds() + TASK_MAPPING_TTL_BUFFER_SECONDS)
+
+
 def _task_mapping_key(session_id: str, task_id: str) -> str:
     return f"fastmcp:task:{session_id}:{task_id}"
 
@@ -375,33 +381,37 @@ async def _store_task_metadata(
     ttl_seconds: Optional[int],
     ttl_ms: Optional[int],
 ) -> None:
+    # Issue all writes in one round-trip; the keys are independent so a
+    # non-transactional pipeline is sufficient.
     async with docket.redis() as redis:
-        await redis.set(
-            docket.key(_task_mapping_key(session_id, task_id)),
-            task_key,
-            ex=ttl_seconds,
-        )
-        await redis.set(
-            docket.key(_task_created_key(session_id, task_id)),
-            created_at.isoformat(),
-            ex=ttl_seconds,
-        )
-        if ttl_ms is not None:
-            await redis.hset(
-                docket.key(_task_meta_key(session_id, task_id)),
-                mapping={"ttl_ms": ttl_ms},
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.set(
+                docket.key(_task_mapping_key(session_id, task_id)),
+                task_key,
+                ex=ttl_seconds,
             )
-            if ttl_seconds:
-                await redis.expire(
+            pipe.set(
+                docket.key(_task_created_key(session_id, task_id)),
+                created_at.isoformat(),
+                ex=ttl_seconds,
+            )
+            if ttl_ms is not None:
+                pipe.hset(
                     docket.key(_task_meta_key(session_id, task_id)),
-                    ttl_seconds,
+                    mapping={"ttl_ms": ttl_ms},
                 )
-        await redis.zadd(
-            docket.key(_task_index_key(session_id)),
-            {task_id: created_at.timestamp()},
-        )
-        if ttl_seconds:
-            await redis.expire(docket.key(_task_index_key(session_id)), ttl_seconds)
+                if ttl_seconds:
+                    pipe.expire(
+                        docket.key(_task_meta_key(session_id, task_id)),
+                        ttl_seconds,
+                    )
+            pipe.zadd(
+                docket.key(_task_index_key(session_id)),
+                {task_id: created_at.timestamp()},
+            )
+            if ttl_seconds:
+                pipe.expire(docket.key(_task_index_key(session_id)), ttl_seconds)
+            await pipe.execute()
 
 
 async def _load_task_record(
@@ -410,21 +420,58 @@ async def _load_task_record(
     task_id: str,
 ) -> TaskRecord:
     async with docket.redis() as redis:
-        task_key_bytes = await redis.get(
-            docket.key(_task_mapping_key(session_id, task_id))
-        )
-        created_at_bytes = await redis.get(
-            docket.key(_task_created_key(session_id, task_id))
-        )
-        meta = await redis.hgetall(docket.key(_task_meta_key(session_id, task_id)))
-
-    if task_key_bytes is None or created_at_bytes is None:
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.get(docket.key(_task_mapping_key(session_id, task_id)))
+            pipe.get(docket.key(_task_created_key(session_id, task_id)))
+            pipe.hgetall(docket.key(_task_meta_key(session_id, task_id)))
+            task_key_bytes, created_at_bytes, meta = await pipe.execute()
+
+    task_record = _task_record_from_values(
+        task_id, task_key_bytes, created_at_bytes, meta
+    )
+    if task_record is None:
         raise McpError(
             ErrorData(
                 code=-32602,
                 message=f"Task {task_id} not found",
             )
         )
+    return task_record
+
+
+async def _load_task_records(
+    docket,
+    session_id: str,
+    task_ids: list[str],
+) -> list[TaskRecord]:
+    """Load several task records in one pipelined round-trip, skipping missing ones."""
+    async with docket.redis() as redis:
+        async with redis.pipeline(transaction=False) as pipe:
+            for task_id in task_ids:
+                pipe.get(docket.key(_task_mapping_key(session_id, task_id)))
+                pipe.get(docket.key(_task_created_key(session_id, task_id)))
+                pipe.hgetall(docket.key(_task_meta_key(session_id, task_id)))
+            values = await pipe.execute()
+
+    records = []
+    for index, task_id in enumerate(task_ids):
+        task_key_bytes, created_at_bytes, meta = values[3 * index : 3 * index + 3]
+        task_record = _task_record_from_values(
+            task_id, task_key_bytes, created_at_bytes, meta
+        )
+        if task_record is not None:
+            records.append(task_record)
+    return records
+
+
+def _task_record_from_values(
+    task_id: str,
+    task_key_bytes: Any,
+    created_at_bytes: Any,
+    meta: Any,
+) -> Optional[TaskRecord]:
+    if task_key_bytes is None or created_at_bytes is None:
+        return None
 
     created_at = datetime.fromisoformat(_decode(created_at_bytes))
     ttl_ms = None
@@ -2,19 +2,75 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence
+from typing import Dict, List, Optional, Sequence, Tuple
+from uuid import uuid4
 
+import numpy as np
 from ase import Atoms
+from ase.calculators.calculator import all_changes, all_properties
+from ase.calculators.singlepoint import SinglePointCalculator
 
-from mcp_atomictoolkit.analysis.autocorrelation import analyze_vacf
-from mcp_atomictoolkit.analysis.structure import analyze_structure
-from mcp_atomictoolkit.analysis.trajectory import analyze_trajectory
+# Analysis, MD, optimizer and structure-building modules pull in matplotlib,
+# pymatgen and SciPy, so workflows import them on first use to keep server
+# start-up and tool listing cheap.
+from mcp_atomictoolkit.artifact_store import artifact_download_url, artifact_store
 from mcp_atomictoolkit.calculators import DEFAULT_CALCULATOR_NAME, resolve_calculator
 from mcp_atomictoolkit.io_handlers import read_structure, write_structure
-from mcp_atomictoolkit.md_runner import run_md
-from mcp_atomictoolkit.optimizers import optimize_structure
-from mcp_atomictoolkit.structure_operations import create_structure, get_structure_info
+
+# A single writer keeps background writes to the same path in submission order.
+_WRITE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="structure-writer")
+
+_CANON_FORMATS = {
+    "png": "png",
+    "pdf": "pdf",
+    "svg": "svg",
+    "eps": "eps",
+    "jpg": "jpg",
+    "jpeg": "jpeg",
+}
+
+
+@dataclass(slots=True)
+class BuildResult:
+    """Metadata for a structure written by ``build_structure_workflow``."""
+
+    filepath: str
+    format: str
+    formula: str
+    num_atoms: int
+    cell: List[List[float]]
+    symmetry: Dict[str, Optional[str]]
+
+    def as_dict(self) -> Dict:
+        """Convert the result to the MCP response dictionary."""
+        return {
+            "filepath": self.filepath,
+            "format": self.format,
+            "formula": self.formula,
+            "num_atoms": self.num_atoms,
+            "cell": self.cell,
+            "symmetry": self.symmetry,
+        }
+
+
+def _canonical_plot_formats(
+    plot_formats: Optional[Sequence[str]],
+) -> Optional[Tuple[str, ...]]:
+    """Lowercase and de-duplicate plot formats once, keeping request order."""
+    if plot_formats is None:
+        return None
+    return tuple(
+        dict.fromkeys(_CANON_FORMATS.get(fmt.lower(), fmt.lower()) for fmt in plot_formats)
+    )
+
+
+def _pathinfo(filepath: str) -> Tuple[str, str]:
+    """Return the absolute path string and extension (without dot) of a path."""
+    path = Path(filepath)
+    return str(path.absolute()), path.suffix[1:]
 
 
 def build_structure_workflow(
@@ -28,8 +84,21 @@ def build_structure_workflow(
     output_filepath: str = "structure.extxyz",
     output_format: Optional[str] = None,
     builder_kwargs: Optional[Dict] = None,
-) -> Dict:
-    """Build an atomic structure, write to disk, and return metadata."""
+    compute_symmetry: bool = True,
+    symmetry_precision: float = 0.01,
+    seed: Optional[int] = None,
+) -> BuildResult:
+    """Build an atomic structure, write to disk, and return metadata.
+
+    ``compute_symmetry=False`` skips the spglib pass; the symmetry fields are
+    then reported as None. ``seed`` makes the random amorphous/liquid builders
+    reproducible.
+    """
+    from mcp_atomictoolkit.structure_operations import (
+        create_structure,
+        get_structure_info,
+    )
+
     builder_overrides = dict(builder_kwargs or {})
     if "crystal_system" in builder_overrides:
         crystal_system = builder_overrides.pop("crystal_system")
@@ -41,6 +110,8 @@ def build_structure_workflow(
         cell = builder_overrides.pop("cell")
     if "cell_size" in builder_overrides:
         cell_size = builder_overrides.pop("cell_size")
+    if "seed" in builder_overrides:
+        seed = builder_overrides.pop("seed")
 
     structure = create_structure(
         formula,
@@ -50,23 +121,26 @@ def build_structure_workflow(
         pbc=pbc,
         cell=cell,
         cell_size=cell_size,
+        seed=seed,
         **builder_overrides,
     )
     write_structure(structure, output_filepath, output_format)
-    info = get_structure_info(structure)
-    symmetry_summary = {
-        "spacegroup": info.get("spacegroup"),
-        "crystal_system": info.get("crystal_system"),
-        "point_group": info.get("point_group"),
-    }
-    return {
-        "filepath": str(Path(output_filepath).absolute()),
-        "format": output_format or Path(output_filepath).suffix[1:],
-        "formula": info.get("formula"),
-        "num_atoms": info.get("num_atoms"),
-        "cell": info.get("cell"),
-        "symmetry": symmetry_summary,
-    }
+    info = get_structure_info(
+        structure, include_symmetry=compute_symmetry, symprec=symmetry_precision
+    )
+    output_path, suffix = _pathinfo(output_filepath)
+    return BuildResult(
+        output_path,
+        output_format or suffix,
+        info["formula"],
+        info["num_atoms"],
+        info["cell"],
+        {
+            "spacegroup": info["spacegroup"],
+            "crystal_system": info["crystal_system"],
+            "point_group": info["point_group"],
+        },
+    )
 
 
 def analyze_structure_workflow(
@@ -80,6 +154,10 @@ def analyze_structure_workflow(
     plot_formats: Optional[Sequence[str]] = None,
 ) -> Dict:
     """Analyze a structure file and return metadata and analysis artifacts."""
+    from mcp_atomictoolkit.analysis.structure import analyze_structure
+    from mcp_atomictoolkit.structure_operations import get_structure_info
+
+    structure = read_structure(filepath, format)
     analysis = analyze_structure(
         filepath=filepath,
         format=format,
@@ -88,12 +166,13 @@ def analyze_structure_workflow(
         rdf_bins=rdf_bins,
         coordination_cutoff=coordination_cutoff,
         coordination_factor=coordination_factor,
-        plot_formats=plot_formats,
+        plot_formats=_canonical_plot_formats(plot_formats),
+        atoms=structure,
     )
-    structure = read_structure(filepath, format)
+    path, suffix = _pathinfo(filepath)
     return {
-        "filepath": str(Path(filepath).absolute()),
-        "format": format or Path(filepath).suffix[1:],
+        "filepath": path,
+        "format": format or suffix,
         "info": get_structure_info(structure),
         "symbols": structure.get_chemical_symbols(),
         "analysis": analysis,
@@ -108,12 +187,19 @@ def write_structure_workflow(
     format: Optional[str] = None,
 ) -> Dict:
     """Write a structure to disk and return metadata."""
-    structure = Atoms(symbols=symbols, positions=positions, cell=cell, pbc=True)
+    # Convert the nested lists once so Atoms copies contiguous float arrays.
+    structure = Atoms(
+        symbols=symbols,
+        positions=np.asarray(positions, dtype=np.float64),
+        cell=np.asarray(cell, dtype=np.float64),
+        pbc=True,
+    )
     write_structure(structure, filepath, format)
+    path, suffix = _pathinfo(filepath)
     return {
         "status": "success",
-        "filepath": str(Path(filepath).absolute()),
-        "format": format or Path(filepath).suffix[1:],
+        "filepath": path,
+        "format": format or suffix,
     }
 
 
@@ -128,8 +214,20 @@ def optimize_structure_workflow(
     constraints: Optional[Dict] = None,
     maxstep: float = 0.04,
     alpha: float = 70.0,
+    optimizer: Optional[str] = None,
+    warmup_steps: int = 10,
+    warmup_fmax: float = 1.0,
+    patience: int = 20,
+    energy_tol: float = 1e-4,
+    async_write: bool = False,
 ) -> Dict:
-    """Optimize a structure read from disk, write results, and return metadata."""
+    """Optimize a structure read from disk, write results, and return metadata.
+
+    With ``async_write`` the output file is written on a background thread and
+    tracked in the artifact store, so artifact downloads wait for the write.
+    """
+    from mcp_atomictoolkit.optimizers import optimize_structure
+
     structure = read_structure(input_filepath, input_format)
     optimized = optimize_structure(
         structure,
@@ -139,16 +237,30 @@ def optimize_structure_workflow(
         constraints=constraints,
         maxstep=maxstep,
         alpha=alpha,
+        optimizer=optimizer,
+        warmup_steps=warmup_steps,
+        warmup_fmax=warmup_fmax,
+        patience=patience,
+        energy_tol=energy_tol,
     )
 
-    write_structure(optimized, output_filepath, output_format)
-    output_path = str(Path(output_filepath).absolute())
+    if async_write:
+        future = _WRITE_EXECUTOR.submit(
+            write_structure, _detached_snapshot(optimized), output_filepath, output_format
+        )
+        artifact_store.track_write(output_filepath, future)
+    else:
+        write_structure(optimized, output_filepath, output_format)
+    output_path, _ = _pathinfo(output_filepath)
 
     return {
         "output_filepath": output_path,
+        "write_pending": async_write,
         "converged": optimized.info.get("optimization_converged", False),
         "steps": optimized.info.get("optimization_steps", 0),
         "final_fmax": optimized.info.get("optimization_fmax", None),
+        "warmup_steps_used": optimized.info.get("warmup_steps_used", 0),
+        "stop_reason": optimized.info.get("optimization_stop_reason"),
         "optimization_error": optimized.info.get("optimization_error"),
         "calculator_requested": optimized.info.get("calculator_requested", calculator_name),
         "calculator_used": optimized.info.get("calculator_used", calculator_name),
@@ -156,12 +268,143 @@ def optimize_structure_workflow(
     }
 
 
+def batch_optimize_structure_workflow(
+    input_filepaths: Sequence[str],
+    input_format: Optional[str] = None,
+    output_dir: str = "optimization_outputs",
+    output_format: str = "extxyz",
+    calculator_name: str = DEFAULT_CALCULATOR_NAME,
+    max_steps: int = 50,
+    fmax: float = 0.1,
+    constraints: Optional[Dict] = None,
+    optimizer: Optional[str] = None,
+    warmup_steps: int = 10,
+    warmup_fmax: float = 1.0,
+    patience: int = 20,
+    energy_tol: float = 1e-4,
+    n_jobs: int = 1,
+) -> Dict:
+    """Optimize several independent structures and write each result.
+
+    ``n_jobs`` > 1 relaxes the structures in that many worker processes, each
+    loading its own calculator; the default of 1 relaxes them in turn in this
+    process. Results are written to ``output_dir`` as
+    ``optimized_<index>.<output_format>``.
+    """
+    from mcp_atomictoolkit.optimizers import optimize_structures_parallel
+
+    structures = [read_structure(filepath, input_format) for filepath in input_filepaths]
+    optimized = optimize_structures_parallel(
+        structures,
+        calculator_name=calculator_name,
+        max_steps=max_steps,
+        fmax=fmax,
+        constraints=constraints,
+        n_jobs=n_jobs,
+        optimizer=optimizer,
+        warmup_steps=warmup_steps,
+        warmup_fmax=warmup_fmax,
+        patience=patience,
+        energy_tol=energy_tol,
+    )
+
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    results = []
+    for index, (filepath, atoms) in enumerate(zip(input_filepaths, optimized)):
+        output_filepath = output_path / f"optimized_{index}.{output_format}"
+        write_structure(atoms, str(output_filepath), output_format)
+        results.append(
+            {
+                "input_filepath": _pathinfo(filepath)[0],
+                "output_filepath": _pathinfo(output_filepath)[0],
+                "energy": atoms.info.get("energy"),
+                "converged": atoms.info.get("optimization_converged", False),
+                "steps": atoms.info.get("optimization_steps", 0),
+                "final_fmax": atoms.info.get("optimization_fmax", None),
+                "stop_reason": atoms.info.get("optimization_stop_reason"),
+                "optimization_error": atoms.info.get("optimization_error"),
+                "calculator_used": atoms.info.get("calculator_used", calculator_name),
+                "calculator_fallbacks": atoms.info.get("calculator_fallbacks", []),
+            }
+        )
+    return {"results": results, "calculator_requested": calculator_name}
+
+
+def _detached_snapshot(atoms: Atoms) -> Atoms:
+    """Copy ``atoms`` with its calculator results frozen in a SinglePointCalculator.
+
+    Calculators are cached and reused, so a queued write must not read the live
+    ``calc.results`` that the next calculation overwrites.
+    """
+    snapshot = atoms.copy()
+    if atoms.calc is not None:
+        results = {
+            key: value for key, value in atoms.calc.results.items() if key in all_properties
+        }
+        snapshot.calc = SinglePointCalculator(snapshot, **results)
+    return snapshot
+
+
+def _single_point_properties(structure: Atoms, compute_stress: bool) -> List[str]:
+    properties = ["energy", "forces"]
+    if compute_stress and all(structure.pbc):
+        properties.append("stress")
+    return properties
+
+
+def _single_point_output(
+    results: Dict,
+    properties: Sequence[str],
+    forces_as_artifact: bool,
+    forces_filepath: str,
+) -> Dict:
+    """Format calculator results as the single-point response fields."""
+    # Some calculators fill stress unasked; only report it when requested.
+    stress = results.get("stress") if "stress" in properties else None
+    forces = results["forces"]
+    if forces_as_artifact:
+        forces_path = Path(forces_filepath)
+        forces_path.parent.mkdir(parents=True, exist_ok=True)
+        np.save(forces_path, forces, allow_pickle=False)
+        record = artifact_store.register(forces_path)
+        forces_output = {
+            "forces_filepath": _pathinfo(forces_filepath)[0],
+            "forces_artifact_id": record.artifact_id,
+            "forces_download_url": artifact_download_url(record),
+            "forces_shape": list(forces.shape),
+            "forces_max": float(np.linalg.norm(forces, axis=1).max(initial=0.0)),
+        }
+    else:
+        forces_output = {"forces": forces.tolist()}
+
+    return {
+        "energy": float(results["energy"]),
+        **forces_output,
+        "stress": stress.tolist() if stress is not None else None,
+    }
+
+
 def single_point_workflow(
     input_filepath: str,
     input_format: Optional[str] = None,
     calculator_name: str = DEFAULT_CALCULATOR_NAME,
+    compute_stress: bool = False,
+    forces_as_artifact: bool = True,
+    forces_filepath: Optional[str] = None,
+    output_dir: str = "analysis_outputs/single_point",
 ) -> Dict:
-    """Compute single-point energy/forces without relaxation or MD."""
+    """Compute single-point energy/forces without relaxation or MD.
+
+    Stress is only evaluated when ``compute_stress`` is set and the structure
+    is fully periodic, since it often costs an extra backward pass. With
+    ``forces_as_artifact`` the forces are saved to ``forces_filepath`` (by
+    default a uniquely named ``forces_<id>.npy`` in ``output_dir``, so calls
+    never overwrite each other) as a ``.npy`` artifact and only summarized in
+    the result instead of inlined.
+    """
+    if forces_as_artifact and forces_filepath is None:
+        forces_filepath = str(Path(output_dir) / f"forces_{uuid4().hex}.npy")
     structure = read_structure(input_filepath, input_format)
     species = sorted(set(structure.get_chemical_symbols()))
     calculator, calculator_used, calculator_errors = resolve_calculator(
@@ -170,17 +413,72 @@ def single_point_workflow(
     )
     structure.calc = calculator
 
-    energy = structure.get_potential_energy()
-    forces = structure.get_forces()
-    stress = None
-    if all(structure.pbc):
-        stress = structure.get_stress().tolist()
+    properties = _single_point_properties(structure, compute_stress)
+    # One calculate() call evaluates every requested property in a single
+    # forward pass instead of dispatching property by property.
+    calculator.calculate(structure, properties, all_changes)
 
     return {
-        "input_filepath": str(Path(input_filepath).absolute()),
-        "energy": energy,
-        "forces": forces.tolist(),
-        "stress": stress,
+        "input_filepath": _pathinfo(input_filepath)[0],
+        **_single_point_output(
+            calculator.results, properties, forces_as_artifact, forces_filepath
+        ),
+        "calculator_requested": calculator_name,
+        "calculator_used": calculator_used,
+        "calculator_fallbacks": calculator_errors,
+    }
+
+
+def batch_single_point_workflow(
+    input_filepaths: Sequence[str],
+    input_format: Optional[str] = None,
+    calculator_name: str = DEFAULT_CALCULATOR_NAME,
+    compute_stress: bool = False,
+    forces_as_artifact: bool = True,
+    output_dir: str = "analysis_outputs/single_point",
+) -> Dict:
+    """Compute single-point energy/forces for several structure files.
+
+    The calculator is resolved once for the union of species and reused for
+    every structure. Forces artifacts are written to ``output_dir`` as
+    ``forces_<batch id>_<index>.npy``, unique per call.
+    """
+    structures = [read_structure(filepath, input_format) for filepath in input_filepaths]
+    species = sorted(
+        {symbol for structure in structures for symbol in structure.get_chemical_symbols()}
+    )
+    calculator, calculator_used, calculator_errors = resolve_calculator(
+        calculator_name,
+        species=species,
+    )
+    properties = [
+        _single_point_properties(structure, compute_stress) for structure in structures
+    ]
+
+    all_results = []
+    for structure, structure_properties in zip(structures, properties):
+        structure.calc = calculator
+        calculator.calculate(structure, structure_properties, all_changes)
+        # The calculator reuses its results dict for the next structure.
+        all_results.append(dict(calculator.results))
+
+    batch_id = uuid4().hex[:12]
+    forces_path = Path(output_dir)
+    return {
+        "results": [
+            {
+                "input_filepath": _pathinfo(filepath)[0],
+                **_single_point_output(
+                    results,
+                    structure_properties,
+                    forces_as_artifact,
+                    str(forces_path / f"forces_{batch_id}_{index}.npy"),
+                ),
+            }
+            for index, (filepath, results, structure_properties) in enumerate(
+                zip(input_filepaths, all_results, properties)
+            )
+        ],
         "calculator_requested": calculator_name,
         "calculator_used": calculator_used,
         "calculator_fallbacks": calculator_errors,
@@ -204,6 +502,8 @@ def run_md_workflow(
     trajectory_interval: int = 1,
 ) -> Dict:
     """Run an MD simulation and return output paths and summary stats."""
+    from mcp_atomictoolkit.md_runner import run_md
+
     return run_md(
         input_filepath=input_filepath,
         input_format=input_format,
@@ -231,8 +531,12 @@ def analyze_trajectory_workflow(
     rdf_bins: int = 200,
     rdf_stride: int = 1,
     plot_formats: Optional[Sequence[str]] = None,
+    n_jobs: int = 1,
+    backend: str = "cpu",
 ) -> Dict:
     """Analyze a trajectory and return analysis artifacts."""
+    from mcp_atomictoolkit.analysis.trajectory import analyze_trajectory
+
     return analyze_trajectory(
         filepath=filepath,
         format=format,
@@ -241,7 +545,9 @@ def analyze_trajectory_workflow(
         rdf_max=rdf_max,
         rdf_bins=rdf_bins,
         rdf_stride=rdf_stride,
-        plot_formats=plot_formats,
+        plot_formats=_canonical_plot_formats(plot_formats),
+        n_jobs=n_jobs,
+        backend=backend,
     )
 
 
@@ -254,11 +560,13 @@ def autocorrelation_workflow(
     plot_formats: Optional[Sequence[str]] = None,
 ) -> Dict:
     """Compute VACF/autocorrelation analysis and diffusion coefficients."""
+    from mcp_atomictoolkit.analysis.autocorrelation import analyze_vacf
+
     return analyze_vacf(
         filepath=filepath,
         format=format,
         output_dir=output_dir,
         timestep_fs=timestep_fs,
         max_lag=max_lag,
-        plot_formats=plot_formats,
+        plot_formats=_canonical_plot_formats(plot_formats),
     )
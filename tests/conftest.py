@@ -1,6 +1,8 @@
 from pathlib import Path
 import sys
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 SRC_PATH = ROOT / "src"
 if str(SRC_PATH) not in sys.path:
@@ -12,3 +14,64 @@ except ModuleNotFoundError:
     matplotlib = None
 else:
     matplotlib.use("Agg")
+
+# Skip collecting optional integration tests (and their imports) when the
+# dependency they exercise is missing.
+collect_ignore = []
+try:
+    import kim_query  # noqa: F401
+except ImportError:
+    collect_ignore.append("test_kim_integration.py")
+
+
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    """Run ``@pytest.mark.anyio`` tests on one asyncio runner for the session."""
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+def atoms_cls():
+    """Return ``ase.Atoms``, importing ASE only for tests that build structures."""
+    from ase import Atoms
+
+    return Atoms
+
+
+@pytest.fixture(scope="session")
+def sample_xyz(tmp_path_factory) -> Path:
+    """Read-only placeholder file for tests that stub out the ASE parser."""
+    path = tmp_path_factory.mktemp("io") / "sample.xyz"
+    path.write_text("data", encoding="utf-8")
+    return path
+
+
+def _install_modules(monkeypatch: pytest.MonkeyPatch, mapping) -> None:
+    """Install ``mapping`` into ``sys.modules``; monkeypatch undoes each entry."""
+    for name, module in mapping.items():
+        monkeypatch.setitem(sys.modules, name, module)
+
+
+@pytest.fixture(scope="session")
+def install_modules():
+    """Return ``install(monkeypatch, mapping)`` for swapping in stub modules.
+
+    Session-scoped so module-scoped fixtures using ``MonkeyPatch.context()``
+    can request it too.
+    """
+    return _install_modules
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _restore_replaced_modules():
+    """Put back any ``sys.modules`` entry a test module swapped for a stub.
+
+    Stub fixtures undo their own patches, so this only matters when one leaks;
+    it keeps test files independent of each other and of ``pytest -n`` worker
+    scheduling.
+    """
+    snapshot = dict(sys.modules)
+    yield
+    for name, module in snapshot.items():
+        if sys.modules.get(name) is not module:
+            sys.modules[name] = module
@@ -23,6 +23,31 @@ def test_compute_vacf_known_signal() -> None:
     assert vacf.tolist() == pytest.approx([14 / 3, 4.0, 3.0])
 
 
+def test_compute_vacf_matches_direct_average() -> None:
+    velocities = np.random.default_rng(0).normal(size=(20, 4, 3))
+    max_lag = 7
+
+    expected = [
+        np.mean(np.sum(velocities[: 20 - lag] * velocities[lag:], axis=2))
+        for lag in range(max_lag + 1)
+    ]
+
+    np.testing.assert_allclose(
+        autocorrelation._compute_vacf(velocities, max_lag=max_lag), expected
+    )
+
+
+def test_compute_vacf_accepts_single_precision() -> None:
+    velocities = np.random.default_rng(1).normal(size=(16, 3, 3))
+
+    single = autocorrelation._compute_vacf(velocities.astype(np.float32), max_lag=5)
+
+    assert single.dtype == np.float64
+    np.testing.assert_allclose(
+        single, autocorrelation._compute_vacf(velocities, max_lag=5), rtol=1e-4, atol=1e-5
+    )
+
+
 def test_analyze_vacf_rejects_empty_trajectory(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(autocorrelation, "_read_trajectory", lambda *_args, **_kwargs: [])
     with pytest.raises(ValueError, match="No frames"):
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+from ase.build import bulk, molecule
+from ase.neighborlist import neighbor_list
+
+from mcp_atomictoolkit.analysis import _histogram
+
+
+@pytest.fixture
+def distances() -> np.ndarray:
+    values = np.random.default_rng(2).uniform(0.0, 6.0, size=500)
+    return np.concatenate([values, [0.0, 5.0]])
+
+
+def test_distance_histogram_matches_numpy(distances: np.ndarray) -> None:
+    expected, _ = np.histogram(distances, bins=20, range=(0.0, 5.0))
+
+    counts = _histogram.distance_histogram(distances, r_max=5.0, bins=20)
+
+    assert counts.dtype == np.float64
+    np.testing.assert_array_equal(counts, expected)
+
+
+def test_histogram_kernel_matches_numpy(distances: np.ndarray) -> None:
+    kernel = getattr(_histogram._histogram_kernel, "py_func", _histogram._histogram_kernel)
+    expected, _ = np.histogram(distances, bins=20, range=(0.0, 5.0))
+    counts = np.zeros(20)
+
+    kernel(distances, 5.0, 20, counts)
+
+    np.testing.assert_array_equal(counts, expected)
+
+
+def test_pair_distances_matches_neighbor_list_for_molecules() -> None:
+    atoms = molecule("C6H6")
+
+    np.testing.assert_allclose(
+        np.sort(_histogram.pair_distances(atoms, r_max=3.0)),
+        np.sort(neighbor_list("d", atoms, cutoff=3.0)),
+    )
+
+
+def test_pair_distances_includes_periodic_images() -> None:
+    atoms = bulk("Cu", "fcc", a=3.6)
+
+    distances = _histogram.pair_distances(atoms, r_max=3.0)
+
+    assert len(distances) == 12
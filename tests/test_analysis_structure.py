@@ -41,3 +41,20 @@ def test_analyze_structure_creates_outputs(
     assert Path(result["outputs"]["summary_json"]).exists()
     assert Path(result["outputs"]["rdf_plot_png"]).exists()
     assert Path(result["outputs"]["coordination_plot_png"]).exists()
+
+
+def test_analyze_structure_uses_preloaded_atoms(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    def fail_read_structure(*_args, **_kwargs):
+        raise AssertionError("structure should not be re-read")
+
+    monkeypatch.setattr(structure, "read_structure", fail_read_structure)
+    atoms = Atoms("Cu", positions=[[0, 0, 0]], cell=[3, 3, 3], pbc=[True] * 3)
+
+    result = structure.analyze_structure(
+        "input.xyz", output_dir=str(tmp_path), rdf_bins=8, atoms=atoms
+    )
+
+    assert result["summary"]["num_atoms"] == 1
+    assert result["summary"]["format"] == "xyz"
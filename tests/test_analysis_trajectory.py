@@ -1,10 +1,12 @@
+import json
 from pathlib import Path
 
 import numpy as np
 import pytest
 from ase import Atoms
+from ase.io import write
 
-from mcp_atomictoolkit.analysis import trajectory
+from mcp_atomictoolkit.analysis import _histogram, trajectory
 
 
 def test_extract_energy_prefers_info_keys() -> None:
@@ -23,6 +25,21 @@ def test_extract_energy_falls_back_to_nan_when_unavailable(monkeypatch: pytest.M
     assert np.isnan(trajectory._extract_energy(atoms))
 
 
+def test_rdf_workers_rejects_invalid_n_jobs() -> None:
+    with pytest.raises(ValueError, match="n_jobs"):
+        trajectory._rdf_workers(0)
+
+
+def test_read_trajectory_streams_frames(tmp_path: Path) -> None:
+    filepath = tmp_path / "traj.extxyz"
+    write(filepath, [Atoms("H", positions=[[0, 0, z]]) for z in (0.0, 0.5, 1.0)])
+
+    frames = trajectory._read_trajectory(str(filepath), None)
+
+    assert not isinstance(frames, list)
+    assert [atoms.positions[0, 2] for atoms in frames] == [0.0, 0.5, 1.0]
+
+
 def test_analyze_trajectory_rejects_empty(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(trajectory, "_read_trajectory", lambda *_args, **_kwargs: [])
     with pytest.raises(ValueError, match="No frames"):
@@ -50,3 +67,83 @@ def test_analyze_trajectory_outputs_files(
     assert Path(result["outputs"]["msd_csv"]).exists()
     assert Path(result["outputs"]["rdf_time_json"]).exists()
     assert Path(result["outputs"]["thermo_plot_png"]).exists()
+
+
+def test_analyze_trajectory_threaded_rdf_matches_serial(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    frames = [
+        Atoms("H2", positions=[[0, 0, 0], [0, 0, d]], cell=[5, 5, 5], pbc=[True] * 3)
+        for d in (0.7, 0.8, 0.9, 1.0)
+    ]
+    for frame in frames:
+        frame.info["potential_energy"] = -1.0
+    monkeypatch.setattr(trajectory, "_read_trajectory", lambda *_args, **_kwargs: iter(frames))
+
+    results = [
+        trajectory.analyze_trajectory(
+            "traj.xyz",
+            output_dir=str(tmp_path / f"jobs_{n_jobs}"),
+            rdf_max=2.0,
+            rdf_bins=8,
+            rdf_stride=2,
+            n_jobs=n_jobs,
+        )
+        for n_jobs in (1, 3)
+    ]
+
+    serial, threaded = (
+        json.loads(Path(result["outputs"]["rdf_time_json"]).read_text())["frames"]
+        for result in results
+    )
+    assert [frame["time_fs"] for frame in serial] == [0.0, 2.0]
+    assert serial == threaded
+
+
+def test_analyze_trajectory_defaults_to_serial_rdf(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    frames = [
+        Atoms("H2", positions=[[0, 0, 0], [0, 0, d]], cell=[5, 5, 5], pbc=[True] * 3)
+        for d in (0.7, 0.8)
+    ]
+    monkeypatch.setattr(trajectory, "_read_trajectory", lambda *_args, **_kwargs: iter(frames))
+
+    def _no_pool(*_args, **_kwargs):
+        raise AssertionError("default analysis must not start an RDF thread pool")
+
+    monkeypatch.setattr(trajectory, "ThreadPoolExecutor", _no_pool)
+
+    result = trajectory.analyze_trajectory(
+        "traj.xyz", output_dir=str(tmp_path), rdf_max=2.0, rdf_bins=8
+    )
+
+    assert result["summary"]["num_frames"] == 2
+
+
+def test_analyze_trajectory_cuda_backend_falls_back_without_cupy(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    frames = [
+        Atoms("H2", positions=[[0, 0, 0], [0, 0, d]], cell=[5, 5, 5], pbc=[True] * 3)
+        for d in (0.74, 0.8)
+    ]
+    for frame in frames:
+        frame.info["potential_energy"] = -1.0
+    monkeypatch.setattr(trajectory, "_read_trajectory", lambda *_args, **_kwargs: frames)
+    monkeypatch.setattr(_histogram, "CUPY_AVAILABLE", False)
+
+    with pytest.warns(RuntimeWarning, match="CuPy"):
+        result = trajectory.analyze_trajectory(
+            "traj.xyz", output_dir=str(tmp_path), rdf_bins=8, backend="CUDA"
+        )
+
+    assert result["summary"]["num_frames"] == 2
+
+
+def test_analyze_trajectory_rejects_unknown_backend(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(trajectory, "_read_trajectory", lambda *_args, **_kwargs: [])
+    with pytest.raises(ValueError, match="Unknown RDF backend"):
+        trajectory.analyze_trajectory("traj.xyz", output_dir=str(tmp_path), backend="opencl")
@@ -1,3 +1,4 @@
+from concurrent.futures import Future
 from pathlib import Path
 
 import pytest
@@ -59,3 +60,34 @@ def test_request_base_url_context_override() -> None:
         assert artifact_store._artifact_base_url() == "https://example.test/base"
     finally:
         artifact_store.reset_request_base_url(token)
+
+
+def test_register_pending_write_exposes_future(tmp_path: Path) -> None:
+    target = tmp_path / "pending.extxyz"
+    future: Future = Future()
+    store = artifact_store.ArtifactStore()
+    store.track_write(target, future)
+
+    record = store.register(target)
+    assert store.is_pending(target)
+    assert store.pending_write(record.artifact_id) is future
+
+    target.write_text("1\nComment\nH 0 0 0\n", encoding="utf-8")
+    future.set_result(None)
+    assert store.get(record.artifact_id) == record
+    assert store.pending_write(record.artifact_id) is None
+    assert not store.is_pending(target)
+    assert store.write_error(record) is None
+
+
+def test_failed_pending_write_is_reported(tmp_path: Path) -> None:
+    target = tmp_path / "pending.extxyz"
+    future: Future = Future()
+    store = artifact_store.ArtifactStore()
+    store.track_write(target, future)
+    record = store.register(target)
+
+    future.set_exception(OSError("disk full"))
+
+    assert store.pending_write(record.artifact_id) is None
+    assert store.write_error(record) == "OSError: disk full"
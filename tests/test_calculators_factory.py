@@ -1,12 +1,26 @@
+import functools
+import re
 import sys
+import threading
 import types
 
 import pytest
 
 from mcp_atomictoolkit import calculators
 
+_RE_KIM_IMPORT_FAILED = re.compile("Failed to import ASE KIM calculator")
+_RE_KIM_FALLBACK = re.compile("falling back to default model")
 
-def _install_orb_stub(monkeypatch):
+
+@pytest.fixture(autouse=True)
+def _fresh_calculator_cache():
+    calculators.clear_calculator_cache()
+    yield
+    calculators.clear_calculator_cache()
+
+
+@functools.lru_cache(maxsize=None)
+def _orb_stub_modules():
     forcefield = types.ModuleType("orb_models.forcefield")
     calculator_mod = types.ModuleType("orb_models.forcefield.calculator")
 
@@ -20,12 +34,14 @@ def _install_orb_stub(monkeypatch):
 
     forcefield.pretrained = types.SimpleNamespace(orb_v2=orb_v2)
     calculator_mod.ORBCalculator = ORBCalculator
+    return {
+        "orb_models.forcefield": forcefield,
+        "orb_models.forcefield.calculator": calculator_mod,
+    }
 
-    monkeypatch.setitem(sys.modules, "orb_models.forcefield", forcefield)
-    monkeypatch.setitem(sys.modules, "orb_models.forcefield.calculator", calculator_mod)
 
-
-def _install_nequix_stub(monkeypatch):
+@functools.lru_cache(maxsize=None)
+def _nequix_stub_modules():
     nequix_calculator = types.ModuleType("nequix.calculator")
 
     class NequixCalculator:
@@ -34,10 +50,11 @@ def _install_nequix_stub(monkeypatch):
             self.backend = backend
 
     nequix_calculator.NequixCalculator = NequixCalculator
-    monkeypatch.setitem(sys.modules, "nequix.calculator", nequix_calculator)
+    return {"nequix.calculator": nequix_calculator}
 
 
-def _install_kim_stub(monkeypatch):
+@functools.lru_cache(maxsize=None)
+def _kim_stub_modules():
     kim_module = types.ModuleType("ase.calculators.kim.kim")
 
     class KIM:
@@ -45,7 +62,7 @@ def _install_kim_stub(monkeypatch):
             self.model_id = model_id
 
     kim_module.KIM = KIM
-    monkeypatch.setitem(sys.modules, "ase.calculators.kim.kim", kim_module)
+    return {"ase.calculators.kim.kim": kim_module}
 
 
 def test_normalize_calculator_name_aliases():
@@ -60,21 +77,56 @@ def test_normalize_species_sorted_unique():
     assert calculators._normalize_species(None) == []
 
 
-def test_get_calculator_orb(monkeypatch):
-    _install_orb_stub(monkeypatch)
+def test_get_calculator_orb(monkeypatch, install_modules):
+    install_modules(monkeypatch, _orb_stub_modules())
     calculator = calculators.get_calculator("orb")
     assert calculator.device == "cpu"
     assert calculator.orbff["device"] == "cpu"
 
 
-def test_get_calculator_nequix(monkeypatch):
-    _install_nequix_stub(monkeypatch)
+def test_freeze_torch_model_disables_parameter_gradients():
+    class Parameter:
+        def __init__(self):
+            self.requires_grad = True
+
+        def requires_grad_(self, flag):
+            self.requires_grad = flag
+
+    class Model:
+        def __init__(self):
+            self.training = True
+            self.weights = [Parameter(), Parameter()]
+
+        def eval(self):
+            self.training = False
+
+        def parameters(self):
+            return iter(self.weights)
+
+    model = Model()
+    calculators._freeze_torch_model(model)
+
+    assert model.training is False
+    assert not any(weight.requires_grad for weight in model.weights)
+
+
+def test_get_calculator_reuses_cached_mlip_instance(monkeypatch, install_modules):
+    install_modules(monkeypatch, _orb_stub_modules())
+    first = calculators.get_calculator("orb")
+    assert calculators.get_calculator("orb") is first
+
+    calculators.clear_calculator_cache()
+    assert calculators.get_calculator("orb") is not first
+
+
+def test_get_calculator_nequix(monkeypatch, install_modules):
+    install_modules(monkeypatch, _nequix_stub_modules())
     calculator = calculators.get_calculator("nequix")
     assert calculator.model_name == calculators.NEQUIX_DEFAULT_MODEL
 
 
-def test_get_calculator_kim(monkeypatch):
-    _install_kim_stub(monkeypatch)
+def test_get_calculator_kim(monkeypatch, install_modules):
+    install_modules(monkeypatch, _kim_stub_modules())
     kim_query = types.ModuleType("kim_query")
     kim_query.get_available_models = lambda species, potential_type: ["TEST_MODEL"]
     monkeypatch.setitem(sys.modules, "kim_query", kim_query)
@@ -83,14 +135,13 @@ def test_get_calculator_kim(monkeypatch):
     assert calculator.model_id == "TEST_MODEL"
 
 
-def test_get_kim_calculator_import_error(monkeypatch):
-    monkeypatch.setitem(sys.modules, "ase.calculators.kim.kim", None)
-    monkeypatch.setitem(sys.modules, "kim_query", None)
-    with pytest.raises(RuntimeError, match="Failed to import ASE KIM calculator"):
+def test_get_kim_calculator_import_error(monkeypatch, install_modules):
+    install_modules(monkeypatch, {"ase.calculators.kim.kim": None, "kim_query": None})
+    with pytest.raises(RuntimeError, match=_RE_KIM_IMPORT_FAILED):
         calculators.get_kim_calculator(species=["Al"])
 
 
-def test_get_kim_calculator_falls_back_to_default_model(monkeypatch):
+def test_get_kim_calculator_falls_back_to_default_model(monkeypatch, install_modules):
     kim_module = types.ModuleType("ase.calculators.kim.kim")
 
     class KIM:
@@ -100,12 +151,13 @@ def test_get_kim_calculator_falls_back_to_default_model(monkeypatch):
             self.model_id = model_id
 
     kim_module.KIM = KIM
-    monkeypatch.setitem(sys.modules, "ase.calculators.kim.kim", kim_module)
     kim_query = types.ModuleType("kim_query")
     kim_query.get_available_models = lambda species, potential_type: ["TEST_MODEL"]
-    monkeypatch.setitem(sys.modules, "kim_query", kim_query)
+    install_modules(
+        monkeypatch, {"ase.calculators.kim.kim": kim_module, "kim_query": kim_query}
+    )
 
-    with pytest.warns(RuntimeWarning, match="falling back to default model"):
+    with pytest.warns(RuntimeWarning, match=_RE_KIM_FALLBACK):
         calculator = calculators.get_kim_calculator(species=["Al"])
 
     assert calculator.model_id == calculators.KIM_DEFAULT_MODEL
@@ -123,3 +175,81 @@ def test_resolve_calculator_falls_back_when_requested_fails(monkeypatch):
     assert calculator == {"name": "orb"}
     assert used == "orb"
     assert any(error.startswith("kim:") for error in errors)
+
+
+def test_resolve_calculator_caches_by_name_and_species(monkeypatch):
+    built = []
+
+    class FakeCalculator:
+        def __init__(self, species):
+            self.species = species
+            self.results = {}
+
+    def fake_get_calculator_by_key(key, species):
+        built.append(tuple(species))
+        return FakeCalculator(species)
+
+    monkeypatch.setattr(calculators, "_get_calculator_by_key", fake_get_calculator_by_key)
+
+    first, _, _ = calculators.resolve_calculator("kim", species=["Si", "Al"])
+    first.results["energy"] = -1.0
+    again, _, _ = calculators.resolve_calculator("openkim", species=["Al", "Si", "Al"])
+    other, _, _ = calculators.resolve_calculator("kim", species=["Cu"])
+
+    assert again is first
+    # Handing out a cached instance must not wipe results another Atoms holds.
+    assert first.results == {"energy": -1.0}
+    assert other is not first
+    assert built == [("Si", "Al"), ("Cu",)]
+
+
+def test_resolve_calculator_caches_per_thread(monkeypatch):
+    monkeypatch.setattr(
+        calculators, "_get_calculator_by_key", lambda key, species: object()
+    )
+    main, _, _ = calculators.resolve_calculator("orb")
+    worker = []
+    thread = threading.Thread(
+        target=lambda: worker.append(calculators.resolve_calculator("orb")[0])
+    )
+    thread.start()
+    thread.join()
+
+    assert calculators.resolve_calculator("orb")[0] is main
+    assert worker[0] is not main
+
+
+def test_resolve_calculator_does_not_cache_fallbacks(monkeypatch):
+    attempts = []
+
+    def fake_get_calculator_by_key(key, species):
+        attempts.append(key)
+        if key == "kim" and attempts.count("kim") == 1:
+            raise RuntimeError("transient kim failure")
+        return {"name": key}
+
+    monkeypatch.setattr(calculators, "_get_calculator_by_key", fake_get_calculator_by_key)
+
+    _, used, errors = calculators.resolve_calculator("auto", species=["Al"])
+    assert (used, len(errors)) == ("orb", 1)
+
+    _, used, errors = calculators.resolve_calculator("auto", species=["Al"])
+    assert (used, errors) == ("kim", [])
+    assert attempts == ["kim", "orb", "kim"]
+
+
+def test_calculator_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(calculators, "_CALCULATOR_CACHE_SIZE", 2)
+    built = []
+
+    def factory(key):
+        return lambda: built.append(key) or key
+
+    calculators._cached_calculator("a", factory("a"))
+    calculators._cached_calculator("b", factory("b"))
+    calculators._cached_calculator("a", factory("a"))
+    calculators._cached_calculator("c", factory("c"))
+    calculators._cached_calculator("a", factory("a"))
+    calculators._cached_calculator("b", factory("b"))
+
+    assert built == ["a", "b", "c", "b"]
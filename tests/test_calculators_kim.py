@@ -1,3 +1,4 @@
+import re
 import sys
 import types
 
@@ -5,53 +6,57 @@ import pytest
 
 from mcp_atomictoolkit import calculators
 
+_RE_KIM_QUERY_MISSING = re.compile("kim-query is unavailable")
 
-def test_select_kim_model_id_uses_first_model(monkeypatch):
-    def fake_get_available_models(species, potential_type):
-        assert species == ["Al", "W"]
-        assert potential_type == ["any"]
-        return ["MODEL_1", "MODEL_2"]
 
-    monkeypatch.setitem(
-        sys.modules, "kim_query", types.SimpleNamespace(get_available_models=fake_get_available_models)
-    )
+@pytest.fixture
+def install_kim_query(monkeypatch):
+    def install(models, expected_species):
+        def fake_get_available_models(species, potential_type):
+            assert species == expected_species
+            assert potential_type == ["any"]
+            return models
 
-    assert calculators._select_kim_model_id(["W", "Al"]) == "MODEL_1"
+        monkeypatch.setitem(
+            sys.modules,
+            "kim_query",
+            types.SimpleNamespace(get_available_models=fake_get_available_models),
+        )
 
+    return install
 
-def test_select_kim_model_id_handles_dict_result(monkeypatch):
-    def fake_get_available_models(species, potential_type):
-        assert species == ["Al"]
-        assert potential_type == ["any"]
-        return [{"model_id": "KIM_ID"}]
 
-    monkeypatch.setitem(
-        sys.modules, "kim_query", types.SimpleNamespace(get_available_models=fake_get_available_models)
-    )
+@pytest.mark.parametrize(
+    ("species", "expected_species", "models", "expected"),
+    [
+        (["W", "Al"], ["Al", "W"], ["MODEL_1", "MODEL_2"], "MODEL_1"),
+        (["Al"], ["Al"], [{"model_id": "KIM_ID"}], "KIM_ID"),
+        (["Al"], ["Al"], [], calculators.KIM_DEFAULT_MODEL),
+    ],
+)
+def test_select_kim_model_id(install_kim_query, species, expected_species, models, expected):
+    install_kim_query(models, expected_species)
 
-    assert calculators._select_kim_model_id(["Al"]) == "KIM_ID"
+    assert calculators._select_kim_model_id(species) == expected
 
 
 def test_select_kim_model_id_warns_when_kim_query_missing(monkeypatch):
     monkeypatch.setitem(sys.modules, "kim_query", None)
 
-    with pytest.warns(RuntimeWarning, match="kim-query is unavailable"):
+    with pytest.warns(RuntimeWarning, match=_RE_KIM_QUERY_MISSING):
         assert (
             calculators._select_kim_model_id(["Al"])
             == calculators.KIM_DEFAULT_MODEL
         )
 
 
-def test_select_kim_model_id_defaults_when_no_models(monkeypatch):
-    def fake_get_available_models(species, potential_type):
-        assert species == ["Al"]
-        assert potential_type == ["any"]
-        return []
-
-    monkeypatch.setitem(
-        sys.modules, "kim_query", types.SimpleNamespace(get_available_models=fake_get_available_models)
-    )
-
-    assert (
-        calculators._select_kim_model_id(["Al"]) == calculators.KIM_DEFAULT_MODEL
-    )
+@pytest.mark.parametrize(
+    ("entry", "expected"),
+    [
+        ("MODEL", "MODEL"),
+        ({"kim_id": "KIM_ID"}, "KIM_ID"),
+        ({"unrelated": "x"}, calculators.KIM_DEFAULT_MODEL),
+    ],
+)
+def test_coerce_kim_model_id(entry, expected):
+    assert calculators._coerce_kim_model_id(entry) == expected
@@ -1,73 +1,91 @@
 import importlib
 import sys
+import threading
 import types
+from concurrent.futures import Future
 
+import pytest
 
-def _load_http_app(monkeypatch):
+
+class FakeStarlette:
+    def __init__(self, routes=None, lifespan=None):
+        self.routes = routes or []
+        self.lifespan = lifespan
+
+
+class FakeRequest:
+    def __init__(self, headers, base_url="http://localhost/"):
+        self.headers = headers
+        self.base_url = base_url
+
+
+class FakeResponse:
+    def __init__(self, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+
+
+class FakeRoute:
+    def __init__(self, path, endpoint, methods=None):
+        self.path = path
+        self.endpoint = endpoint
+        self.methods = methods
+
+
+class FakeMount:
+    def __init__(self, path, app):
+        self.path = path
+        self.app = app
+
+
+class FakeMCP:
+    def http_app(self, **kwargs):
+        async def app(scope, receive, send):
+            return None
+
+        return app
+
+
+def _stub_modules():
     starlette_applications = types.ModuleType("starlette.applications")
     starlette_requests = types.ModuleType("starlette.requests")
     starlette_responses = types.ModuleType("starlette.responses")
     starlette_routing = types.ModuleType("starlette.routing")
 
-    class FakeStarlette:
-        def __init__(self, routes=None, lifespan=None):
-            self.routes = routes or []
-            self.lifespan = lifespan
-
-    class FakeRequest:
-        def __init__(self, headers, base_url="http://localhost/"):
-            self.headers = headers
-            self.base_url = base_url
-
-    class FakeResponse:
-        def __init__(self, *args, **kwargs):
-            self.args = args
-            self.kwargs = kwargs
-
-    class FakeRoute:
-        def __init__(self, path, endpoint, methods=None):
-            self.path = path
-            self.endpoint = endpoint
-            self.methods = methods
-
-    class FakeMount:
-        def __init__(self, path, app):
-            self.path = path
-            self.app = app
-
-    starlette_applications.Starlette = FakeStarlette
-    starlette_requests.Request = FakeRequest
-    starlette_responses.FileResponse = FakeResponse
-    starlette_responses.JSONResponse = FakeResponse
-    starlette_responses.RedirectResponse = FakeResponse
-    starlette_responses.Response = FakeResponse
-    starlette_routing.Route = FakeRoute
-    starlette_routing.Mount = FakeMount
-
-    monkeypatch.setitem(sys.modules, "starlette.applications", starlette_applications)
-    monkeypatch.setitem(sys.modules, "starlette.requests", starlette_requests)
-    monkeypatch.setitem(sys.modules, "starlette.responses", starlette_responses)
-    monkeypatch.setitem(sys.modules, "starlette.routing", starlette_routing)
+    vars(starlette_applications).update(Starlette=FakeStarlette)
+    vars(starlette_requests).update(Request=FakeRequest)
+    vars(starlette_responses).update(
+        FileResponse=FakeResponse,
+        JSONResponse=FakeResponse,
+        RedirectResponse=FakeResponse,
+        Response=FakeResponse,
+    )
+    vars(starlette_routing).update(Route=FakeRoute, Mount=FakeMount)
 
     mcp_server_stub = types.ModuleType("mcp_atomictoolkit.mcp_server")
-
-    class FakeMCP:
-        def http_app(self, **kwargs):
-            async def app(scope, receive, send):
-                return None
-
-            return app
-
     mcp_server_stub.mcp = FakeMCP()
-    monkeypatch.setitem(sys.modules, "mcp_atomictoolkit.mcp_server", mcp_server_stub)
 
-    sys.modules.pop("mcp_atomictoolkit.http_app", None)
-    return importlib.import_module("mcp_atomictoolkit.http_app")
+    return {
+        "starlette.applications": starlette_applications,
+        "starlette.requests": starlette_requests,
+        "starlette.responses": starlette_responses,
+        "starlette.routing": starlette_routing,
+        "mcp_atomictoolkit.mcp_server": mcp_server_stub,
+    }
+
 
+@pytest.fixture(scope="module")
+def http_app(install_modules):
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        install_modules(monkeypatch, _stub_modules())
+        monkeypatch.delitem(sys.modules, "mcp_atomictoolkit.http_app", raising=False)
+        module = importlib.import_module("mcp_atomictoolkit.http_app")
+        yield module
+        sys.modules.pop("mcp_atomictoolkit.http_app", None)
 
-def test_accept_header_compat_adds_json(monkeypatch):
-    http_app = _load_http_app(monkeypatch)
 
+@pytest.mark.anyio
+async def test_accept_header_compat_adds_json(http_app):
     seen = {}
 
     async def app(scope, receive, send):
@@ -79,15 +97,12 @@ def test_accept_header_compat_adds_json(monkeypatch):
         "headers": [(b"host", b"example.test")],
     }
 
-    import asyncio
-
-    asyncio.run(wrapper(scope, None, None))
+    await wrapper(scope, None, None)
     assert any(name == b"accept" for name, _ in seen["headers"])
 
 
-def test_accept_header_compat_replaces_invalid(monkeypatch):
-    http_app = _load_http_app(monkeypatch)
-
+@pytest.mark.anyio
+async def test_accept_header_compat_replaces_invalid(http_app):
     seen = {}
 
     async def app(scope, receive, send):
@@ -99,15 +114,12 @@ def test_accept_header_compat_replaces_invalid(monkeypatch):
         "headers": [(b"accept", b"text/plain")],
     }
 
-    import asyncio
-
-    asyncio.run(wrapper(scope, None, None))
-    accept = dict(seen["headers"]).get(b"accept")
+    await wrapper(scope, None, None)
+    accept = next((value for name, value in seen["headers"] if name == b"accept"), None)
     assert accept == b"application/json, text/event-stream"
 
 
-def test_public_base_url_prefers_forwarded_headers(monkeypatch):
-    http_app = _load_http_app(monkeypatch)
+def test_public_base_url_prefers_forwarded_headers(http_app):
     request = http_app.Request(
         {"x-forwarded-proto": "https", "x-forwarded-host": "example.test"},
         base_url="http://ignored/",
@@ -115,18 +127,15 @@ def test_public_base_url_prefers_forwarded_headers(monkeypatch):
     assert http_app._public_base_url(request) == "https://example.test"
 
 
-def test_public_base_url_falls_back_to_request_base(monkeypatch):
-    http_app = _load_http_app(monkeypatch)
+def test_public_base_url_falls_back_to_request_base(http_app):
     request = http_app.Request({}, base_url="http://local.test/root/")
     assert http_app._public_base_url(request) == "http://local.test/root"
 
 
-def test_handle_server_card_points_to_docs_and_static_lists(monkeypatch):
-    http_app = _load_http_app(monkeypatch)
+@pytest.mark.anyio
+async def test_handle_server_card_points_to_docs_and_static_lists(http_app):
     request = http_app.Request({"host": "local.test"}, base_url="http://local.test/")
-    import asyncio
-
-    response = asyncio.run(http_app.handle_server_card(request))
+    response = await http_app.handle_server_card(request)
     payload = response.args[0]
     assert payload["documentationUrl"] == "http://local.test/docs"
     assert payload["capabilities"]["tools"]["listChanged"] is False
@@ -138,12 +147,38 @@ def test_handle_server_card_points_to_docs_and_static_lists(monkeypatch):
     assert "read_structure_file" in tool_names
 
 
-def test_handle_docs_serves_readme(monkeypatch, tmp_path):
-    http_app = _load_http_app(monkeypatch)
+@pytest.mark.anyio
+async def test_handle_docs_serves_readme(http_app, monkeypatch, tmp_path):
     readme = tmp_path / "README.md"
     readme.write_text("hello", encoding="utf-8")
     monkeypatch.setattr(http_app, "README_PATH", readme)
-    import asyncio
-
-    response = asyncio.run(http_app.handle_docs(http_app.Request({})))
+    response = await http_app.handle_docs(http_app.Request({}))
     assert response.args[0] == readme
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("fails", [False, True])
+async def test_handle_artifact_download_awaits_pending_write(http_app, tmp_path, fails):
+    target = tmp_path / "pending.extxyz"
+    future = Future()
+    http_app.artifact_store.track_write(target, future)
+    record = http_app.artifact_store.register(target)
+
+    def finish():
+        if fails:
+            future.set_exception(OSError("disk full"))
+        else:
+            target.write_text("1\nComment\nH 0 0 0\n", encoding="utf-8")
+            future.set_result(None)
+
+    threading.Timer(0.05, finish).start()
+    request = http_app.Request({})
+    request.path_params = {"artifact_id": record.artifact_id}
+
+    response = await http_app.handle_artifact_download(request)
+
+    if fails:
+        assert response.kwargs["status_code"] == 500
+        assert response.args[0]["detail"] == "OSError: disk full"
+    else:
+        assert response.kwargs["path"] == record.filepath
@@ -1,18 +1,20 @@
 from pathlib import Path
+import re
 
 import pytest
-from ase import Atoms
 
 from mcp_atomictoolkit import io_handlers
 
+_RE_FAILED_READ = re.compile("Failed to read file")
+
 
 def test_read_structure_missing_file_raises(tmp_path: Path) -> None:
     with pytest.raises(FileNotFoundError):
         io_handlers.read_structure(tmp_path / "missing.xyz")
 
 
-def test_write_and_read_structure_roundtrip_xyz(tmp_path: Path) -> None:
-    atoms = Atoms("H2", positions=[[0, 0, 0], [0, 0, 0.74]])
+def test_write_and_read_structure_roundtrip_xyz(atoms_cls, tmp_path: Path) -> None:
+    atoms = atoms_cls("H2", positions=[[0, 0, 0], [0, 0, 0.74]])
     target = tmp_path / "mol.xyz"
 
     io_handlers.write_structure(atoms, target)
@@ -22,17 +24,16 @@ def test_write_and_read_structure_roundtrip_xyz(tmp_path: Path) -> None:
     assert len(loaded) == 2
 
 
-def test_read_structure_wraps_ase_errors(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
-    file_path = tmp_path / "a.xyz"
-    file_path.write_text("invalid")
-
+def test_read_structure_wraps_ase_errors(
+    monkeypatch: pytest.MonkeyPatch, sample_xyz: Path
+) -> None:
     def _boom(*_args, **_kwargs):
         raise RuntimeError("bad parse")
 
     monkeypatch.setattr(io_handlers, "read", _boom)
 
-    with pytest.raises(ValueError, match="Failed to read file"):
-        io_handlers.read_structure(file_path)
+    with pytest.raises(ValueError, match=_RE_FAILED_READ):
+        io_handlers.read_structure(sample_xyz)
 
 
 def test_get_supported_formats_contains_expected_keys() -> None:
@@ -1,86 +1,60 @@
 from pathlib import Path
 import importlib
+import re
 import sys
 import types
 
 import pytest
 
+_RE_FAILED = {op: re.compile(f"Failed to {op} file") for op in ("read", "write")}
 
-def _load_io_handlers(monkeypatch):
+
+@pytest.fixture(scope="module")
+def io_handlers(install_modules):
     ase_stub = types.ModuleType("ase")
     ase_io_stub = types.ModuleType("ase.io")
     ase_stub.Atoms = object
     ase_io_stub.read = lambda *args, **kwargs: None
     ase_io_stub.write = lambda *args, **kwargs: None
-    monkeypatch.setitem(sys.modules, "ase", ase_stub)
-    monkeypatch.setitem(sys.modules, "ase.io", ase_io_stub)
-    sys.modules.pop("mcp_atomictoolkit.io_handlers", None)
-    return importlib.import_module("mcp_atomictoolkit.io_handlers")
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        install_modules(monkeypatch, {"ase": ase_stub, "ase.io": ase_io_stub})
+        monkeypatch.delitem(sys.modules, "mcp_atomictoolkit.io_handlers", raising=False)
+        module = importlib.import_module("mcp_atomictoolkit.io_handlers")
+        yield module
+        sys.modules.pop("mcp_atomictoolkit.io_handlers", None)
 
 
-def test_read_structure_missing_file(monkeypatch, tmp_path: Path) -> None:
-    io_handlers = _load_io_handlers(monkeypatch)
+def test_read_structure_missing_file(io_handlers, tmp_path: Path) -> None:
     with pytest.raises(FileNotFoundError):
         io_handlers.read_structure(tmp_path / "missing.xyz")
 
 
-def test_read_structure_uses_extension(monkeypatch, tmp_path: Path) -> None:
-    io_handlers = _load_io_handlers(monkeypatch)
-    sample = tmp_path / "sample.xyz"
-    sample.write_text("data", encoding="utf-8")
-
+@pytest.mark.parametrize(
+    ("op", "should_raise"),
+    [("read", False), ("read", True), ("write", False), ("write", True)],
+)
+def test_structure_io_uses_extension_and_wraps_errors(
+    io_handlers, monkeypatch, sample_xyz: Path, op: str, should_raise: bool
+) -> None:
     captured = {}
 
-    def fake_read(filepath, format=None):
-        captured["filepath"] = filepath
+    def fake_io(*args, format=None, **kwargs):
+        if should_raise:
+            raise RuntimeError("boom")
         captured["format"] = format
         return "atoms"
 
-    monkeypatch.setattr(io_handlers, "read", fake_read)
-
-    atoms = io_handlers.read_structure(sample)
-
-    assert atoms == "atoms"
-    assert captured["format"] == "xyz"
-
-
-def test_read_structure_raises_value_error(monkeypatch, tmp_path: Path) -> None:
-    io_handlers = _load_io_handlers(monkeypatch)
-    sample = tmp_path / "sample.xyz"
-    sample.write_text("data", encoding="utf-8")
-
-    def fake_read(filepath, format=None):
-        raise RuntimeError("boom")
-
-    monkeypatch.setattr(io_handlers, "read", fake_read)
-
-    with pytest.raises(ValueError, match="Failed to read file"):
-        io_handlers.read_structure(sample)
+    def call():
+        if op == "read":
+            return io_handlers.read_structure(sample_xyz)
+        return io_handlers.write_structure("atoms", sample_xyz.with_name("output.xyz"))
 
+    monkeypatch.setattr(io_handlers, op, fake_io)
 
-def test_write_structure_uses_extension(monkeypatch, tmp_path: Path) -> None:
-    io_handlers = _load_io_handlers(monkeypatch)
-    captured = {}
-
-    def fake_write(filepath, atoms, format=None, **kwargs):
-        captured["filepath"] = filepath
-        captured["format"] = format
-        captured["atoms"] = atoms
-        captured["kwargs"] = kwargs
-
-    monkeypatch.setattr(io_handlers, "write", fake_write)
-
-    io_handlers.write_structure("atoms", tmp_path / "output.xyz")
-
+    if should_raise:
+        with pytest.raises(ValueError, match=_RE_FAILED[op]):
+            call()
+        return
+    result = call()
     assert captured["format"] == "xyz"
-
-
-def test_write_structure_raises_value_error(monkeypatch, tmp_path: Path) -> None:
-    io_handlers = _load_io_handlers(monkeypatch)
-    def fake_write(filepath, atoms, format=None, **kwargs):
-        raise RuntimeError("boom")
-
-    monkeypatch.setattr(io_handlers, "write", fake_write)
-
-    with pytest.raises(ValueError, match="Failed to write file"):
-        io_handlers.write_structure("atoms", tmp_path / "output.xyz")
+    assert result == ("atoms" if op == "read" else None)
@@ -15,17 +15,7 @@ def test_ase_kim_uses_first_model_for_si():
     if not models:
         pytest.skip("OpenKIM query returned no models for Si.")
 
-    def _coerce_model_id(entry):
-        if isinstance(entry, str):
-            return entry
-        if isinstance(entry, dict):
-            for key in ("model", "model_id", "kim_id", "extended_id", "id"):
-                value = entry.get(key)
-                if value:
-                    return value
-        return str(entry)
-
-    first_model_id = _coerce_model_id(models[0])
+    first_model_id = calculators._coerce_kim_model_id(models[0])
     model_id = calculators._select_kim_model_id(["Si"])
     if model_id == calculators.KIM_DEFAULT_MODEL:
         pytest.skip("No OpenKIM models discovered for Si.")
@@ -20,3 +20,13 @@ def test_run_tool_returns_structured_error_payload() -> None:
     assert result["hints"]
     assert "cubic" in result["hints"][0]
     assert "Do not replace the workflow" in result["next_action"]
+
+
+def test_run_tool_converts_typed_results_to_dicts() -> None:
+    class _Result:
+        def as_dict(self):
+            return {"status": "ok"}
+
+    assert _run_tool("build_structure_workflow", lambda **_kwargs: _Result()) == {
+        "status": "ok"
+    }
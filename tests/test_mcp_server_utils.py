@@ -4,86 +4,99 @@ import types
 
 import pytest
 
+# _compact_kwargs does not mutate its input, so these can be shared.
+_LONG_STR = "a" * 201
+_LONG_LIST = list(range(26))
+_LONG_DICT = {str(i): i for i in range(26)}
+_COMPACT_INPUT = {
+    "long_str": _LONG_STR,
+    "long_list": _LONG_LIST,
+    "long_dict": _LONG_DICT,
+    "short": "ok",
+}
+_EXPECTED_COMPACT = {
+    "long_str": "<str:201 chars>",
+    "long_list": "<list:26 items>",
+    "long_dict": "<dict:26 keys>",
+    "short": "ok",
+}
+
+_WORKFLOWS_STUB = types.ModuleType("mcp_atomictoolkit.workflows.core")
+for _workflow_name in (
+    "analyze_structure_workflow",
+    "analyze_trajectory_workflow",
+    "autocorrelation_workflow",
+    "batch_optimize_structure_workflow",
+    "batch_single_point_workflow",
+    "build_structure_workflow",
+    "optimize_structure_workflow",
+    "run_md_workflow",
+    "single_point_workflow",
+    "write_structure_workflow",
+):
+    setattr(
+        _WORKFLOWS_STUB,
+        _workflow_name,
+        lambda _name=_workflow_name, **kwargs: {"status": "ok", "name": _name},
+    )
 
-def _load_mcp_server(monkeypatch):
-    fastmcp_stub = types.ModuleType("fastmcp")
-    fastmcp_server_stub = types.ModuleType("fastmcp.server")
-    fastmcp_tasks_stub = types.ModuleType("fastmcp.server.tasks")
 
-    class TaskConfig:
-        def __init__(self, mode="optional"):
-            self.mode = mode
+class TaskConfig:
+    def __init__(self, mode="optional"):
+        self.mode = mode
 
-    class FakeFastMCP:
-        def __init__(self, name: str, tasks=None, **_kwargs):
-            self.name = name
-            self.tasks = tasks
 
-        def tool(self, *args, **_kwargs):
-            def decorator(func):
-                return func
+class FakeFastMCP:
+    def __init__(self, name: str, tasks=None, **_kwargs):
+        self.name = name
+        self.tasks = tasks
 
-            return decorator
+    def tool(self, *args, **_kwargs):
+        def decorator(func):
+            return func
 
-        def http_app(self, **kwargs):
-            async def app(scope, receive, send):
-                return None
+        return decorator
 
-            return app
+    def http_app(self, **kwargs):
+        async def app(scope, receive, send):
+            return None
 
+        return app
+
+
+def _stub_modules():
+    fastmcp_stub = types.ModuleType("fastmcp")
+    fastmcp_server_stub = types.ModuleType("fastmcp.server")
+    fastmcp_tasks_stub = types.ModuleType("fastmcp.server.tasks")
     fastmcp_stub.FastMCP = FakeFastMCP
     fastmcp_tasks_stub.TaskConfig = TaskConfig
-    monkeypatch.setitem(sys.modules, "fastmcp", fastmcp_stub)
-    monkeypatch.setitem(sys.modules, "fastmcp.server", fastmcp_server_stub)
-    monkeypatch.setitem(sys.modules, "fastmcp.server.tasks", fastmcp_tasks_stub)
-
     task_support_stub = types.ModuleType("mcp_atomictoolkit.task_support")
+    task_support_stub.apply_task_support_patches = lambda: None
+
+    return {
+        "fastmcp": fastmcp_stub,
+        "fastmcp.server": fastmcp_server_stub,
+        "fastmcp.server.tasks": fastmcp_tasks_stub,
+        "mcp_atomictoolkit.task_support": task_support_stub,
+        "mcp_atomictoolkit.workflows.core": _WORKFLOWS_STUB,
+    }
 
-    def apply_task_support_patches():
-        return None
 
-    task_support_stub.apply_task_support_patches = apply_task_support_patches
-    monkeypatch.setitem(sys.modules, "mcp_atomictoolkit.task_support", task_support_stub)
+@pytest.fixture(scope="module")
+def mcp_server(install_modules):
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        install_modules(monkeypatch, _stub_modules())
+        monkeypatch.delitem(sys.modules, "mcp_atomictoolkit.mcp_server", raising=False)
+        module = importlib.import_module("mcp_atomictoolkit.mcp_server")
+        yield module
+        sys.modules.pop("mcp_atomictoolkit.mcp_server", None)
 
-    workflows_stub = types.ModuleType("mcp_atomictoolkit.workflows.core")
-    for name in (
-        "analyze_structure_workflow",
-        "analyze_trajectory_workflow",
-        "autocorrelation_workflow",
-        "build_structure_workflow",
-        "optimize_structure_workflow",
-        "run_md_workflow",
-        "single_point_workflow",
-        "write_structure_workflow",
-    ):
-        setattr(
-            workflows_stub,
-            name,
-            lambda _name=name, **kwargs: {"status": "ok", "name": _name},
-        )
-    monkeypatch.setitem(sys.modules, "mcp_atomictoolkit.workflows.core", workflows_stub)
-
-    sys.modules.pop("mcp_atomictoolkit.mcp_server", None)
-    return importlib.import_module("mcp_atomictoolkit.mcp_server")
-
-
-def test_compact_kwargs_truncates(monkeypatch):
-    mcp_server = _load_mcp_server(monkeypatch)
-    data = {
-        "long_str": "a" * 201,
-        "long_list": list(range(26)),
-        "long_dict": {str(i): i for i in range(26)},
-        "short": "ok",
-    }
-    compacted = mcp_server._compact_kwargs(data)
-    assert compacted["long_str"] == "<str:201 chars>"
-    assert compacted["long_list"] == "<list:26 items>"
-    assert compacted["long_dict"] == "<dict:26 keys>"
-    assert compacted["short"] == "ok"
 
+def test_compact_kwargs_truncates(mcp_server):
+    assert mcp_server._compact_kwargs(_COMPACT_INPUT) == _EXPECTED_COMPACT
 
-def test_error_hints_for_hcp(monkeypatch):
-    mcp_server = _load_mcp_server(monkeypatch)
+
+def test_error_hints_for_hcp(mcp_server):
     hints = mcp_server._error_hints(
         "build_structure_workflow",
         {"crystal_system": "hcp", "builder_kwargs": {}},
@@ -92,8 +105,7 @@ def test_error_hints_for_hcp(monkeypatch):
     assert any("hcp is not a cubic lattice" in hint for hint in hints)
 
 
-def test_tool_error_response_includes_hints(monkeypatch):
-    mcp_server = _load_mcp_server(monkeypatch)
+def test_tool_error_response_includes_hints(mcp_server):
     response = mcp_server._tool_error_response(
         "run_md_workflow",
         FileNotFoundError("file not found"),
@@ -107,9 +119,7 @@ def test_tool_error_response_includes_hints(monkeypatch):
     assert any("Use returned artifact download_url links" in hint for hint in response["hints"])
 
 
-def test_run_tool_success_and_failure(monkeypatch):
-    mcp_server = _load_mcp_server(monkeypatch)
-
+def test_run_tool_success_and_failure(mcp_server):
     def ok_tool():
         return {"status": "ok"}
 
@@ -0,0 +1,225 @@
+import multiprocessing
+
+import pytest
+from ase.build import bulk, molecule
+from ase.calculators.emt import EMT
+from scipy.optimize import OptimizeResult
+
+from mcp_atomictoolkit import optimizers
+
+
+@pytest.fixture
+def emt_calculator(monkeypatch: pytest.MonkeyPatch) -> list:
+    resolved = []
+
+    def fake_resolve_calculator(calculator_name, species=None):
+        resolved.append(tuple(species))
+        return EMT(), "emt", []
+
+    monkeypatch.setattr(optimizers, "resolve_calculator", fake_resolve_calculator)
+    return resolved
+
+
+def test_apply_constraints_accepts_mixed_bond_specs() -> None:
+    atoms = molecule("CH4")
+    optimizers.apply_constraints(
+        atoms,
+        {
+            "fixed_atoms": [0],
+            "fixed_bonds": [{"indices": [0, 1]}, {"a": 0, "b": 2}, (0, 3)],
+            "fixed_cell": True,
+        },
+    )
+
+    fix_atoms, fix_bonds = atoms.constraints
+    assert fix_atoms.index.tolist() == [0]
+    assert [list(pair) for pair in fix_bonds.pairs] == [[0, 1], [0, 2], [0, 3]]
+    assert atoms.info["fixed_cell"] is True
+
+
+def test_optimize_structure_records_convergence_metadata(emt_calculator) -> None:
+    copper = bulk("Cu", "fcc", a=3.7, cubic=True)
+    copper.rattle(0.05, seed=3)
+
+    relaxed = optimizers.optimize_structure(copper, max_steps=200, fmax=0.05)
+
+    assert relaxed.info["optimization_converged"] is True
+    assert 0 < relaxed.info["optimization_steps"] < 200
+    assert relaxed.info["optimization_fmax"] < 0.05
+    assert relaxed.info["calculator_used"] == "emt"
+    assert relaxed.info["optimization_stop_reason"] == "fmax"
+
+
+def test_optimize_structure_uses_scipy_for_small_molecules(
+    emt_calculator, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fail_build_optimizer(*args, **kwargs):
+        raise AssertionError("ASE optimizer should not be built")
+
+    monkeypatch.setattr(optimizers, "build_optimizer", fail_build_optimizer)
+    nitrogen = molecule("N2")
+    nitrogen.positions[1, 2] += 0.1
+
+    relaxed = optimizers.optimize_structure(nitrogen, max_steps=100, fmax=0.01)
+
+    assert relaxed.info["optimization_converged"] is True
+    assert relaxed.info["optimization_fmax"] < 0.01
+    assert "optimization_error" not in relaxed.info
+
+
+def test_optimize_structure_scipy_honours_patience(emt_calculator) -> None:
+    nitrogen = molecule("N2")
+    nitrogen.positions[1, 2] += 0.1
+
+    relaxed = optimizers.optimize_structure(
+        nitrogen, max_steps=100, fmax=1e-12, patience=2, energy_tol=10.0
+    )
+
+    assert relaxed.info["optimization_stop_reason"] == "patience"
+    assert relaxed.info["optimization_steps"] == 2
+
+
+def test_optimize_structure_reports_scipy_line_search_failure(
+    emt_calculator, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    nitrogen = molecule("N2")
+    nitrogen.positions[1, 2] += 0.1
+
+    def failed_minimize(fun, x0, **_kwargs):
+        return OptimizeResult(
+            x=x0, nit=3, status=2, message="ABNORMAL_TERMINATION_IN_LNSRCH"
+        )
+
+    monkeypatch.setattr(optimizers, "minimize", failed_minimize)
+
+    relaxed = optimizers.optimize_structure(nitrogen, max_steps=100, fmax=0.01)
+
+    assert relaxed.info["optimization_converged"] is False
+    assert relaxed.info["optimization_stop_reason"] == "line_search"
+
+
+@pytest.mark.parametrize(
+    ("status", "message", "expected"),
+    [
+        (1, "STOP: TOTAL NO. OF ITERATIONS REACHED LIMIT", "max_steps"),
+        (0, "CONVERGENCE: RELATIVE REDUCTION OF F <= FACTR*EPSMCH", "ftol"),
+        (2, "ABNORMAL: ", "line_search"),
+        (2, "ERROR: NO FEASIBLE SOLUTION", "scipy_error"),
+    ],
+)
+def test_scipy_stop_reason_maps_result_status(status: int, message: str, expected: str) -> None:
+    result = OptimizeResult(status=status, message=message)
+    assert optimizers._scipy_stop_reason(result, converged=False, plateaued=False) == expected
+
+
+def test_optimize_structure_counts_warmup_steps(emt_calculator) -> None:
+    copper = bulk("Cu", "fcc", a=3.7, cubic=True)
+    copper.rattle(0.2, seed=5)
+
+    relaxed = optimizers.optimize_structure(
+        copper, max_steps=200, fmax=0.05, warmup_steps=5, warmup_fmax=0.01
+    )
+
+    assert relaxed.info["warmup_steps_used"] == 5
+    assert relaxed.info["optimization_converged"] is True
+    assert relaxed.info["optimization_steps"] > 5
+
+
+def test_optimize_structure_stops_when_energy_plateaus(emt_calculator) -> None:
+    copper = bulk("Cu", "fcc", a=3.7, cubic=True)
+    copper.rattle(0.05, seed=6)
+
+    relaxed = optimizers.optimize_structure(
+        copper, optimizer="fire", max_steps=200, fmax=1e-8, patience=3, energy_tol=10.0
+    )
+
+    assert relaxed.info["optimization_stop_reason"] == "patience"
+    assert relaxed.info["optimization_steps"] == 3
+
+
+def test_optimize_structure_bfgs_hessian_warm_start(emt_calculator) -> None:
+    copper = bulk("Cu", "fcc", a=3.7, cubic=True)
+    copper.rattle(0.05, seed=4)
+
+    cold = optimizers.optimize_structure(
+        copper, optimizer="bfgs", max_steps=200, fmax=0.01, return_hessian=True
+    )
+    hessian = cold.info["_bfgs_H"]
+    warm = optimizers.optimize_structure(
+        copper,
+        optimizer="bfgs",
+        max_steps=200,
+        fmax=0.01,
+        initial_hessian=hessian,
+    )
+
+    assert hessian.shape == (3 * len(copper), 3 * len(copper))
+    assert "_bfgs_H" not in warm.info
+    assert warm.info["optimization_converged"] is True
+    assert warm.info["optimization_steps"] <= cold.info["optimization_steps"]
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("bfgs", "BFGS"),
+        ("LBFGS", "LBFGS"),
+        ("lbfgs-linesearch", "LBFGSLineSearch"),
+        ("bfgs_linesearch", "BFGSLineSearch"),
+        ("fire", "FIRE"),
+    ],
+)
+def test_build_optimizer_dispatches_by_name(name: str, expected: str) -> None:
+    atoms = bulk("Cu", "fcc", a=3.6)
+    atoms.calc = EMT()
+    assert type(optimizers.build_optimizer(atoms, name)).__name__ == expected
+
+
+def test_build_optimizer_is_silent_by_default(capsys: pytest.CaptureFixture) -> None:
+    atoms = bulk("Cu", "fcc", a=3.7)
+    atoms.calc = EMT()
+    optimizers.build_optimizer(atoms, "bfgs").run(fmax=0.05, steps=3)
+    assert capsys.readouterr().out == ""
+
+
+def test_build_optimizer_rejects_unknown_name() -> None:
+    with pytest.raises(ValueError, match="Unknown optimizer"):
+        optimizers.build_optimizer(bulk("Cu", "fcc", a=3.6), "newton")
+
+
+def test_optimize_structures_parallel_runs_serially_for_one_job(emt_calculator) -> None:
+    structures = [bulk("Cu", "fcc", a=a, cubic=True) for a in (3.6, 3.7)]
+
+    relaxed = optimizers.optimize_structures_parallel(
+        structures, n_jobs=1, optimizer="fire", max_steps=5
+    )
+
+    assert [atoms.info["calculator_used"] for atoms in relaxed] == ["emt", "emt"]
+    assert len(emt_calculator) == 2
+    assert all(atoms.calc is None for atoms in relaxed)
+
+
+def test_optimize_structures_parallel_returns_picklable_results(
+    emt_calculator, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Spawned workers would not see the EMT stub, so fork them instead; results
+    # still travel back through pickle, which is what this exercises.
+    fork_context = multiprocessing.get_context("fork")
+    monkeypatch.setattr(optimizers.multiprocessing, "get_context", lambda _method: fork_context)
+    structures = [bulk("Cu", "fcc", a=a, cubic=True) for a in (3.6, 3.7)]
+    for atoms in structures:
+        atoms.rattle(0.05, seed=7)
+
+    relaxed = optimizers.optimize_structures_parallel(
+        structures, n_jobs=2, max_steps=20, fmax=0.05
+    )
+
+    assert [atoms.info["calculator_used"] for atoms in relaxed] == ["emt", "emt"]
+    assert all(atoms.calc is None for atoms in relaxed)
+    assert all(atoms.arrays["forces"].shape == (4, 3) for atoms in relaxed)
+    assert relaxed[0].info["energy"] != relaxed[1].info["energy"]
+
+
+def test_optimize_structures_parallel_rejects_invalid_n_jobs() -> None:
+    with pytest.raises(ValueError, match="n_jobs"):
+        optimizers.optimize_structures_parallel([], n_jobs=0)
@@ -2,28 +2,49 @@ import importlib
 import sys
 import types
 
+import pytest
 
-def test_configure_jax_for_cpu_overrides_environment(monkeypatch):
+import mcp_atomictoolkit
+from mcp_atomictoolkit import calculators
+
+_CPU_ENV = {
+    "JAX_PLATFORMS": "cpu",
+    "JAX_PLATFORM_NAME": "cpu",
+    "CUDA_VISIBLE_DEVICES": "",
+    "JAX_CUDA_VISIBLE_DEVICES": "",
+}
+
+
+@pytest.fixture
+def gpu_env(monkeypatch):
+    """Point JAX at the GPU; monkeypatch restores os.environ afterwards."""
     monkeypatch.setenv("JAX_PLATFORMS", "cuda")
     monkeypatch.setenv("JAX_PLATFORM_NAME", "gpu")
     monkeypatch.setenv("CUDA_VISIBLE_DEVICES", "0")
     monkeypatch.setenv("JAX_CUDA_VISIBLE_DEVICES", "0")
+    monkeypatch.delenv("JAX_COMPILATION_CACHE_DIR", raising=False)
+
 
+@pytest.fixture
+def fresh_calculators(gpu_env, monkeypatch):
+    """Re-run the calculators module body, then restore the original module."""
+    monkeypatch.delitem(sys.modules, "mcp_atomictoolkit.calculators")
+    monkeypatch.setattr(mcp_atomictoolkit, "calculators", calculators)
+    module = importlib.import_module("mcp_atomictoolkit.calculators")
+    yield module
     sys.modules.pop("mcp_atomictoolkit.calculators", None)
-    calculators = importlib.import_module("mcp_atomictoolkit.calculators")
 
-    assert calculators.os.environ["JAX_PLATFORMS"] == "cpu"
-    assert calculators.os.environ["JAX_PLATFORM_NAME"] == "cpu"
-    assert calculators.os.environ["CUDA_VISIBLE_DEVICES"] == ""
-    assert calculators.os.environ["JAX_CUDA_VISIBLE_DEVICES"] == ""
 
+def _assert_cpu_env(environ):
+    for name, value in _CPU_ENV.items():
+        assert environ[name] == value
+
+
+def test_configure_jax_for_cpu_overrides_environment(fresh_calculators):
+    _assert_cpu_env(fresh_calculators.os.environ)
 
-def test_get_nequix_calculator_enforces_cpu_env(monkeypatch):
-    monkeypatch.setenv("JAX_PLATFORMS", "cuda")
-    monkeypatch.setenv("JAX_PLATFORM_NAME", "gpu")
-    monkeypatch.setenv("CUDA_VISIBLE_DEVICES", "0")
-    monkeypatch.setenv("JAX_CUDA_VISIBLE_DEVICES", "0")
 
+def test_get_nequix_calculator_enforces_cpu_env(gpu_env, monkeypatch, install_modules):
     # Provide a lightweight fake nequix module so the test does not need the
     # heavyweight dependency to be installed.
     calculator_module = types.ModuleType("nequix.calculator")
@@ -35,19 +56,17 @@ def test_get_nequix_calculator_enforces_cpu_env(monkeypatch):
 
     calculator_module.NequixCalculator = DummyNequixCalculator
 
-    nequix_module = types.ModuleType("nequix")
-
-    monkeypatch.setitem(sys.modules, "nequix", nequix_module)
-    monkeypatch.setitem(sys.modules, "nequix.calculator", calculator_module)
-
-    sys.modules.pop("mcp_atomictoolkit.calculators", None)
-    calculators = importlib.import_module("mcp_atomictoolkit.calculators")
+    install_modules(
+        monkeypatch,
+        {"nequix": types.ModuleType("nequix"), "nequix.calculator": calculator_module},
+    )
 
     calculator = calculators.get_nequix_calculator()
 
     assert isinstance(calculator, DummyNequixCalculator)
     assert calculator.backend == "jax"
-    assert calculators.os.environ["JAX_PLATFORMS"] == "cpu"
-    assert calculators.os.environ["JAX_PLATFORM_NAME"] == "cpu"
-    assert calculators.os.environ["CUDA_VISIBLE_DEVICES"] == ""
-    assert calculators.os.environ["JAX_CUDA_VISIBLE_DEVICES"] == ""
+    assert (
+        calculators.os.environ["JAX_COMPILATION_CACHE_DIR"]
+        == calculators.JAX_COMPILATION_CACHE_DIR
+    )
+    _assert_cpu_env(calculators.os.environ)
@@ -1,16 +1,23 @@
+import re
+
 import hypothesis.strategies as st
+import numpy as np
 import pytest
-from ase import Atoms
-from hypothesis import given
+from hypothesis import example, given, settings
 
 from mcp_atomictoolkit.structure_operations import (
     _assign_species,
     _resolve_cell,
+    _symmetry_summary,
     create_structure,
     get_structure_info,
     manipulate_structure,
 )
 
+_RE_CELL_SIZE = re.compile("cell_size")
+_RE_UNKNOWN_STRUCTURE = re.compile("Unknown structure type")
+_RE_UNKNOWN_OPERATION = re.compile("Unknown operation")
+
 
 def test_resolve_cell_prefers_explicit_cell() -> None:
     cell = [[1, 0, 0], [0, 2, 0], [0, 0, 3]]
@@ -19,19 +26,76 @@ def test_resolve_cell_prefers_explicit_cell() -> None:
 
 
 def test_resolve_cell_raises_for_invalid_cell_size() -> None:
-    with pytest.raises(ValueError, match="cell_size"):
+    with pytest.raises(ValueError, match=_RE_CELL_SIZE):
         _resolve_cell(cell=None, cell_size=(1, 2), default_size=5)
 
 
+@settings(max_examples=25, deadline=None)
 @given(num_atoms=st.integers(min_value=1, max_value=50))
+@example(num_atoms=1)
+@example(num_atoms=50)
 def test_assign_species_matches_requested_atom_count(num_atoms: int) -> None:
     symbols = _assign_species("Cu2Zn", num_atoms=num_atoms)
     assert len(symbols) == num_atoms
     assert set(symbols).issubset({"Cu", "Zn"})
 
 
+def test_create_amorphous_positions_lie_inside_cell() -> None:
+    atoms = create_structure(
+        "Cu2Zn", structure_type="amorphous", num_atoms=30, cell_size=(6, 7, 8)
+    )
+
+    assert len(atoms) == 30
+    assert atoms.get_chemical_formula() == "Cu20Zn10"
+    scaled = atoms.get_scaled_positions(wrap=False)
+    assert ((scaled >= 0) & (scaled < 1)).all()
+
+
+def test_create_amorphous_supports_skewed_cell() -> None:
+    cell = [[6.0, 0.0, 0.0], [2.0, 6.0, 0.0], [0.0, 1.0, 6.0]]
+    atoms = create_structure("Cu", structure_type="amorphous", num_atoms=20, cell=cell)
+
+    scaled = atoms.get_scaled_positions(wrap=False)
+    assert ((scaled >= 0) & (scaled < 1)).all()
+
+
+def test_create_amorphous_seed_is_reproducible() -> None:
+    first, second, other = (
+        create_structure("Cu", structure_type="liquid", num_atoms=10, seed=seed)
+        for seed in (7, 7, 8)
+    )
+
+    np.testing.assert_array_equal(first.positions, second.positions)
+    assert not np.allclose(first.positions, other.positions)
+
+
+def test_create_bicrystal_stacks_grains_along_axis() -> None:
+    atoms = create_structure(
+        "Cu",
+        structure_type="bicrystal",
+        grain_size=(2, 2, 2),
+        interface_axis="z",
+        interface_gap=1.0,
+    )
+
+    assert len(atoms) == 2 * 32
+    assert atoms.cell.lengths()[2] == pytest.approx(17.0)
+    assert atoms.positions[32:, 2].min() >= 8.0
+
+
+def test_create_polycrystal_combines_all_grains() -> None:
+    grain = create_structure("Cu", structure_type="bulk", crystal_system="fcc") * (2, 2, 2)
+    atoms = create_structure(
+        "Cu", structure_type="polycrystal", num_grains=3, grain_size=(2, 2, 2)
+    )
+
+    assert len(atoms) == 3 * len(grain)
+    assert atoms.pbc.all()
+    assert atoms.cell.lengths().tolist() == pytest.approx([16.0, 16.0, 16.0])
+
+
 def test_create_structure_unknown_type_raises() -> None:
-    with pytest.raises(ValueError, match="Unknown structure type"):
+    with pytest.raises(ValueError, match=_RE_UNKNOWN_STRUCTURE):
         create_structure("Cu", structure_type="nonsense")
 
 
@@ -58,24 +122,67 @@ def test_create_bulk_hcp_defaults_to_non_cubic_cell() -> None:
     atoms = create_structure("Cu", structure_type="bulk", crystal_system="hcp", lattice_constant=2.556, c=4.174)
     assert len(atoms) > 0
 
-def test_manipulate_structure_translate_and_supercell() -> None:
-    atoms = Atoms("H", positions=[[0, 0, 0]], cell=[5, 5, 5], pbc=[True, True, True])
-    moved = manipulate_structure(atoms.copy(), "translate", vector=[1, 2, 3])
-    expanded = manipulate_structure(atoms.copy(), "supercell", size=(2, 1, 1))
+def test_manipulate_structure_translate_and_supercell(atoms_cls) -> None:
+    atoms = atoms_cls("H", positions=[[0, 0, 0]], cell=[5, 5, 5], pbc=[True, True, True])
+    # "supercell" returns a new Atoms while "translate" works in place, so
+    # expanding first lets both operations share the original without copies.
+    expanded = manipulate_structure(atoms, "supercell", size=(2, 1, 1))
+    moved = manipulate_structure(atoms, "translate", vector=[1, 2, 3])
 
     assert moved.positions[0].tolist() == pytest.approx([1, 2, 3])
     assert len(expanded) == 2
 
 
-def test_manipulate_unknown_operation_raises() -> None:
-    atoms = Atoms("H", positions=[[0, 0, 0]])
-    with pytest.raises(ValueError, match="Unknown operation"):
+def test_manipulate_structure_strain_scales_cell_and_positions(atoms_cls) -> None:
+    atoms = atoms_cls("H2", positions=[[1, 1, 1], [2, 3, 4]], cell=[5, 5, 5], pbc=True)
+    scaled_before = atoms.get_scaled_positions()
+
+    strained = manipulate_structure(atoms, "strain", strain=0.1)
+
+    assert strained.cell.lengths().tolist() == pytest.approx([5.5, 5.5, 5.5])
+    assert strained.positions[1].tolist() == pytest.approx([2.2, 3.3, 4.4])
+    assert strained.get_scaled_positions() == pytest.approx(scaled_before)
+
+
+def test_manipulate_unknown_operation_raises(atoms_cls) -> None:
+    atoms = atoms_cls("H", positions=[[0, 0, 0]])
+    with pytest.raises(ValueError, match=_RE_UNKNOWN_OPERATION):
         manipulate_structure(atoms, "bad")
 
 
-def test_get_structure_info_non_periodic_has_no_symmetry() -> None:
-    atoms = Atoms("H2", positions=[[0, 0, 0], [0, 0, 0.74]], cell=[10, 10, 10], pbc=[False, False, False])
+def test_get_structure_info_non_periodic_has_no_symmetry(atoms_cls) -> None:
+    atoms = atoms_cls("H2", positions=[[0, 0, 0], [0, 0, 0.74]], cell=[10, 10, 10], pbc=[False, False, False])
     info = get_structure_info(atoms)
 
     assert info["num_atoms"] == 2
     assert info["spacegroup"] is None
+
+
+def test_get_structure_info_reports_and_caches_symmetry() -> None:
+    atoms = create_structure("Cu", structure_type="bulk", crystal_system="fcc")
+    info = get_structure_info(atoms)
+    hits = _symmetry_summary.cache_info().hits
+
+    assert info["spacegroup"] == "Fm-3m"
+    assert info["crystal_system"] == "cubic"
+    assert get_structure_info(atoms.copy()) == info
+    assert _symmetry_summary.cache_info().hits == hits + 1
+
+
+def test_get_structure_info_cache_ignores_lattice_translations() -> None:
+    atoms = create_structure("Cu", structure_type="bulk", crystal_system="fcc")
+    info = get_structure_info(atoms)
+    translated = manipulate_structure(atoms.copy(), "translate", vector=atoms.cell[0])
+    translated.wrap()
+    hits = _symmetry_summary.cache_info().hits
+
+    assert get_structure_info(translated)["spacegroup"] == info["spacegroup"]
+    assert _symmetry_summary.cache_info().hits == hits + 1
+
+
+def test_get_structure_info_can_skip_symmetry() -> None:
+    atoms = create_structure("Cu", structure_type="bulk", crystal_system="fcc")
+    info = get_structure_info(atoms, include_symmetry=False)
+
+    assert info["num_atoms"] == len(atoms)
+    assert info["spacegroup"] is None
@@ -1,4 +1,4 @@
-import asyncio
+import contextlib
 
 import pytest
 
@@ -44,67 +44,67 @@ def _build_request_context(session_id: str) -> tuple[RequestContext, _DummySessi
     return context, session
 
 
-def test_task_flow_end_to_end() -> None:
-    async def _run() -> None:
-        apply_task_support_patches()
-        server = FastMCP("test", tasks=True)
-
-        @server.tool(task=TaskConfig(mode="required"))
-        async def long_tool(value: int) -> dict:
-            return {"value": value * 2}
-
-        request_context, _session = _build_request_context("session-1")
-        token = request_ctx.set(request_context)
-        try:
-            async with server._docket_lifespan():
-                async with Context(fastmcp=server):
-                    create_result = await handle_tool_as_task(
-                        server,
-                        "long_tool",
-                        {"value": 3},
-                        {"ttl": 60_000},
-                    )
-                    task_meta = create_result.meta["modelcontextprotocol.io/task"]
-                    task_id = task_meta["taskId"]
-
-                    status = await tasks_get_handler(server, {"taskId": task_id})
-                    assert status.taskId == task_id
-                    assert status.ttl == 60_000
-
-                    list_result = await tasks_list_handler(server, {"limit": 5})
-                    assert any(task.taskId == task_id for task in list_result.tasks)
-
-                    result = await tasks_result_handler(server, {"taskId": task_id})
-                    assert result.structuredContent == {"value": 6}
-                    assert result.meta["modelcontextprotocol.io/related-task"]["taskId"] == task_id
-
-                    with pytest.raises(McpError) as exc:
-                        await tasks_cancel_handler(server, {"taskId": task_id})
-                    assert exc.value.error.code == -32602
-        finally:
-            request_ctx.reset(token)
-
-    asyncio.run(_run())
-
-
-def test_tasks_list_rejects_invalid_pagination() -> None:
-    async def _run() -> None:
-        apply_task_support_patches()
-        server = FastMCP("test", tasks=True)
-
-        request_context, _session = _build_request_context("session-2")
-        token = request_ctx.set(request_context)
-        try:
-            async with server._docket_lifespan():
-                async with Context(fastmcp=server):
-                    with pytest.raises(McpError) as exc:
-                        await tasks_list_handler(server, {"limit": "bad"})
-                    assert exc.value.error.code == -32602
-
-                    with pytest.raises(McpError) as exc:
-                        await tasks_list_handler(server, {"cursor": "-1"})
-                    assert exc.value.error.code == -32602
-        finally:
-            request_ctx.reset(token)
-
-    asyncio.run(_run())
+@pytest.fixture(scope="module")
+async def server_with_tasks(anyio_backend):
+    apply_task_support_patches()
+    server = FastMCP("test", tasks=True)
+
+    @server.tool(task=TaskConfig(mode="required"))
+    async def long_tool(value: int) -> dict:
+        return {"value": value * 2}
+
+    async with server._docket_lifespan():
+        yield server
+
+
+@contextlib.asynccontextmanager
+async def _request_scope(server: FastMCP, session_id: str):
+    request_context, _session = _build_request_context(session_id)
+    token = request_ctx.set(request_context)
+    try:
+        async with Context(fastmcp=server):
+            yield
+    finally:
+        request_ctx.reset(token)
+
+
+@pytest.mark.anyio
+async def test_task_flow_end_to_end(server_with_tasks) -> None:
+    server = server_with_tasks
+    async with _request_scope(server, "session-1"):
+        create_result = await handle_tool_as_task(
+            server,
+            "long_tool",
+            {"value": 3},
+            {"ttl": 60_000},
+        )
+        task_meta = create_result.meta["modelcontextprotocol.io/task"]
+        task_id = task_meta["taskId"]
+
+        status = await tasks_get_handler(server, {"taskId": task_id})
+        assert status.taskId == task_id
+        assert status.ttl == 60_000
+
+        list_result = await tasks_list_handler(server, {"limit": 5})
+        assert any(task.taskId == task_id for task in list_result.tasks)
+
+        result = await tasks_result_handler(server, {"taskId": task_id})
+        assert result.structuredContent == {"value": 6}
+        assert result.meta["modelcontextprotocol.io/related-task"]["taskId"] == task_id
+
+        with pytest.raises(McpError) as exc:
+            await tasks_cancel_handler(server, {"taskId": task_id})
+        assert exc.value.error.code == -32602
+
+
+@pytest.mark.anyio
+async def test_tasks_list_rejects_invalid_pagination(server_with_tasks) -> None:
+    server = server_with_tasks
+    async with _request_scope(server, "session-2"):
+        with pytest.raises(McpError) as exc:
+            await tasks_list_handler(server, {"limit": "bad"})
+        assert exc.value.error.code == -32602
+
+        with pytest.raises(McpError) as exc:
+            await tasks_list_handler(server, {"cursor": "-1"})
+        assert exc.value.error.code == -32602
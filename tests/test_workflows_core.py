@@ -0,0 +1,225 @@
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+from ase.build import bulk
+from ase.calculators.emt import EMT
+from ase.io import read, write
+
+from mcp_atomictoolkit.artifact_store import artifact_store
+from mcp_atomictoolkit.workflows import core
+
+
+@pytest.fixture
+def copper_file(tmp_path: Path) -> str:
+    filepath = tmp_path / "copper.extxyz"
+    write(filepath, bulk("Cu", "fcc", a=3.6, cubic=True))
+    return str(filepath)
+
+
+@pytest.fixture
+def emt_calculator(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        core, "resolve_calculator", lambda _name, species=None: (EMT(), "emt", [])
+    )
+
+
+@pytest.mark.parametrize("compute_stress", [False, True])
+def test_single_point_workflow_reports_requested_properties(
+    copper_file: str, emt_calculator: None, compute_stress: bool
+) -> None:
+    result = core.single_point_workflow(
+        copper_file, compute_stress=compute_stress, forces_as_artifact=False
+    )
+
+    assert isinstance(result["energy"], float)
+    assert len(result["forces"]) == 4
+    assert (result["stress"] is not None) is compute_stress
+    assert result["calculator_used"] == "emt"
+
+
+def test_single_point_workflow_saves_forces_artifact(
+    copper_file: str, emt_calculator: None, tmp_path: Path
+) -> None:
+    forces_filepath = tmp_path / "out" / "forces.npy"
+
+    result = core.single_point_workflow(copper_file, forces_filepath=str(forces_filepath))
+
+    assert "forces" not in result
+    assert result["forces_filepath"] == str(forces_filepath)
+    assert result["forces_shape"] == [4, 3]
+    assert np.load(forces_filepath).shape == (4, 3)
+    assert result["forces_max"] == pytest.approx(0.0, abs=1e-8)
+    record = artifact_store.get(result["forces_artifact_id"])
+    assert record.filepath == forces_filepath.resolve()
+    assert result["forces_download_url"].endswith(f"/{record.artifact_id}/forces.npy")
+
+
+def test_single_point_workflow_defaults_to_unique_forces_paths(
+    copper_file: str, emt_calculator: None, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    first = core.single_point_workflow(copper_file)
+    second = core.single_point_workflow(copper_file)
+
+    assert first["forces_filepath"] != second["forces_filepath"]
+    assert first["forces_artifact_id"] != second["forces_artifact_id"]
+    output_dir = tmp_path / "analysis_outputs" / "single_point"
+    assert sorted(output_dir.iterdir()) == sorted(
+        Path(result["forces_filepath"]) for result in (first, second)
+    )
+
+
+def test_batch_single_point_workflow_resolves_calculator_once(
+    copper_file: str, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    resolved = []
+
+    def fake_resolve_calculator(_name, species=None):
+        resolved.append(species)
+        return EMT(), "emt", []
+
+    monkeypatch.setattr(core, "resolve_calculator", fake_resolve_calculator)
+    nickel_file = tmp_path / "nickel.extxyz"
+    write(nickel_file, bulk("Ni", "fcc", a=3.52))
+
+    result = core.batch_single_point_workflow(
+        [copper_file, str(nickel_file)], output_dir=str(tmp_path / "forces")
+    )
+
+    assert resolved == [["Cu", "Ni"]]
+    assert [entry["forces_shape"] for entry in result["results"]] == [[4, 3], [1, 3]]
+    energies = [entry["energy"] for entry in result["results"]]
+    assert energies[0] != energies[1]
+    assert [Path(entry["forces_filepath"]).parent for entry in result["results"]] == [
+        tmp_path / "forces"
+    ] * 2
+    assert len(list((tmp_path / "forces").glob("forces_*_1.npy"))) == 1
+
+
+def test_batch_optimize_structure_workflow_writes_each_result(
+    copper_file: str, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    from mcp_atomictoolkit import optimizers
+
+    monkeypatch.setattr(
+        optimizers, "resolve_calculator", lambda _name, species=None: (EMT(), "emt", [])
+    )
+    nickel_file = tmp_path / "nickel.extxyz"
+    write(nickel_file, bulk("Ni", "fcc", a=3.6))
+
+    result = core.batch_optimize_structure_workflow(
+        [copper_file, str(nickel_file)],
+        output_dir=str(tmp_path / "relaxed"),
+        max_steps=5,
+        warmup_steps=0,
+    )
+
+    assert [entry["calculator_used"] for entry in result["results"]] == ["emt", "emt"]
+    written = read(result["results"][1]["output_filepath"])
+    assert written.get_chemical_formula() == "Ni"
+    assert written.get_potential_energy() == pytest.approx(result["results"][1]["energy"])
+
+
+def test_write_structure_workflow_writes_atoms(tmp_path: Path) -> None:
+    filepath = tmp_path / "dimer.extxyz"
+
+    result = core.write_structure_workflow(
+        positions=[[0.0, 0.0, 0.0], [0.0, 0.0, 1.1]],
+        symbols=["N", "N"],
+        cell=[[5.0, 0.0, 0.0], [0.0, 5.0, 0.0], [0.0, 0.0, 5.0]],
+        filepath=str(filepath),
+    )
+
+    written = read(filepath)
+    assert result["format"] == "extxyz"
+    assert written.get_chemical_formula() == "N2"
+    assert written.positions[1, 2] == pytest.approx(1.1)
+
+
+@pytest.mark.parametrize(
+    ("compute_symmetry", "spacegroup"), [(True, "Fm-3m"), (False, None)]
+)
+def test_build_structure_workflow_symmetry_is_optional(
+    tmp_path: Path, compute_symmetry: bool, spacegroup
+) -> None:
+    result = core.build_structure_workflow(
+        "Cu",
+        lattice_constant=3.6,
+        output_filepath=str(tmp_path / "cu.extxyz"),
+        compute_symmetry=compute_symmetry,
+    )
+
+    assert result.num_atoms == 4
+    assert result.symmetry["spacegroup"] == spacegroup
+    assert result.as_dict()["format"] == "extxyz"
+
+
+def test_build_structure_workflow_seeds_random_builders(tmp_path: Path) -> None:
+    positions = []
+    for name, kwargs in (("a", {"seed": 3}), ("b", {"builder_kwargs": {"seed": 3}})):
+        result = core.build_structure_workflow(
+            "Cu",
+            structure_type="amorphous",
+            output_filepath=str(tmp_path / f"{name}.extxyz"),
+            compute_symmetry=False,
+            **kwargs,
+        )
+        positions.append(read(result.filepath).positions)
+
+    np.testing.assert_allclose(positions[0], positions[1])
+
+
+def test_optimize_structure_workflow_async_write_defers_to_artifact_store(
+    copper_file: str, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    from mcp_atomictoolkit import optimizers
+
+    shared = EMT()
+    monkeypatch.setattr(
+        optimizers, "resolve_calculator", lambda _name, species=None: (shared, "emt", [])
+    )
+    release = threading.Event()
+
+    def gated_write(atoms, filepath, format=None):
+        release.wait(timeout=10)
+        return write(filepath, atoms, format=format)
+
+    monkeypatch.setattr(core, "write_structure", gated_write)
+    output = tmp_path / "optimized.extxyz"
+
+    result = core.optimize_structure_workflow(
+        copper_file, output_filepath=str(output), max_steps=2, async_write=True
+    )
+    record = artifact_store.register(output)
+
+    assert result["write_pending"] is True
+    assert not output.exists()
+    pending = artifact_store.pending_write(record.artifact_id)
+    # The cached calculator is reused before the queued write runs.
+    shared.reset()
+    release.set()
+    pending.result(timeout=10)
+    assert artifact_store.write_error(record) is None
+    written = read(output)
+    assert written.get_chemical_formula() == "Cu4"
+    assert written.calc is not None
+    assert isinstance(written.get_potential_energy(), float)
+    assert written.get_forces().shape == (4, 3)
+
+
+def test_autocorrelation_workflow_canonicalizes_plot_formats(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from mcp_atomictoolkit.analysis import autocorrelation
+
+    captured = {}
+    monkeypatch.setattr(
+        autocorrelation, "analyze_vacf", lambda **kwargs: captured.update(kwargs) or {}
+    )
+
+    core.autocorrelation_workflow("traj.extxyz", plot_formats=["PNG", "Svg", "png"])
+
+    assert captured["plot_formats"] == ("png", "svg")